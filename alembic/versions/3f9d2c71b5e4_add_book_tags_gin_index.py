@@ -0,0 +1,32 @@
+"""Add book tags GIN index.
+
+Revision ID: 3f9d2c71b5e4
+Revises: ac8eb9db918c
+Create Date: 2026-10-15 09:40:03.552917
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9d2c71b5e4"
+down_revision: str | None = "ac8eb9db918c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_books_tags_gin",
+        "books",
+        ["tags"],
+        unique=False,
+        postgresql_using="gin",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_books_tags_gin", table_name="books", postgresql_using="gin", if_exists=True)
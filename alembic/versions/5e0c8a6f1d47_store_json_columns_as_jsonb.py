@@ -0,0 +1,56 @@
+"""Store storage config and user preferences as JSONB.
+
+Revision ID: 5e0c8a6f1d47
+Revises: d4a87f3e2b16
+Create Date: 2026-10-15 12:05:17.904812
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e0c8a6f1d47"
+down_revision: str | None = "d4a87f3e2b16"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "storage",
+        "config",
+        type_=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using="config::jsonb",
+    )
+    op.alter_column(
+        "users",
+        "preferences",
+        type_=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using="preferences::jsonb",
+    )
+    op.create_index("ix_storage_config_gin", "storage", ["config"], postgresql_using="gin", if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_storage_config_gin", table_name="storage", if_exists=True)
+    op.alter_column(
+        "users",
+        "preferences",
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using="preferences::json",
+    )
+    op.alter_column(
+        "storage",
+        "config",
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using="config::json",
+    )
@@ -0,0 +1,29 @@
+"""Use server timestamps for users.
+
+Revision ID: 7b1e4a0c93d2
+Revises: 3f9d2c71b5e4
+Create Date: 2026-10-15 10:05:27.904113
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b1e4a0c93d2"
+down_revision: str | None = "3f9d2c71b5e4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column("users", "created_at", server_default=sa.text("now()"))
+    op.alter_column("users", "updated_at", server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    op.alter_column("users", "updated_at", server_default=None)
+    op.alter_column("users", "created_at", server_default=None)
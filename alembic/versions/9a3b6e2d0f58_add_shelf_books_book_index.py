@@ -0,0 +1,31 @@
+"""Add shelf_books (book_id, shelf_id) index.
+
+Revision ID: 9a3b6e2d0f58
+Revises: 5e0c8a6f1d47
+Create Date: 2026-10-15 12:31:09.551236
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a3b6e2d0f58"
+down_revision: str | None = "5e0c8a6f1d47"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_shelf_books_book_shelf",
+        "shelf_books",
+        ["book_id", "shelf_id"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_shelf_books_book_shelf", table_name="shelf_books", if_exists=True)
@@ -0,0 +1,35 @@
+"""Add book title indexes.
+
+Revision ID: ac8eb9db918c
+Revises: ce16b23bf3e1
+Create Date: 2026-10-15 09:12:41.318204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ac8eb9db918c"
+down_revision: str | None = "ce16b23bf3e1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_books_user_title", "books", ["user_id", "title"], unique=False, if_not_exists=True)
+    op.create_index(
+        "ix_books_title_lower",
+        "books",
+        [sa.text("lower(title) text_pattern_ops")],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_books_title_lower", table_name="books", if_exists=True)
+    op.drop_index("ix_books_user_title", table_name="books", if_exists=True)
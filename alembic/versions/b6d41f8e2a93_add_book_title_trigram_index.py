@@ -0,0 +1,44 @@
+"""Add book title trigram index.
+
+Revision ID: b6d41f8e2a93
+Revises: 9a3b6e2d0f58
+Create Date: 2026-10-15 23:05:12.184630
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b6d41f8e2a93"
+down_revision: str | None = "9a3b6e2d0f58"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_books_title_trgm",
+        "books",
+        ["title"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+        if_not_exists=True,
+    )
+    op.drop_index("ix_books_title_lower", table_name="books", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_books_title_lower",
+        "books",
+        [sa.text("lower(title) text_pattern_ops")],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_index("ix_books_title_trgm", table_name="books", if_exists=True)
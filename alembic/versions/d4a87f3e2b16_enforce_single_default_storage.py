@@ -0,0 +1,45 @@
+"""Enforce a single default storage per user.
+
+Revision ID: d4a87f3e2b16
+Revises: 7b1e4a0c93d2
+Create Date: 2026-10-15 11:20:48.126375
+
+Any user with several default storages keeps only the one with the lowest ID
+as default before the partial unique index is created.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a87f3e2b16"
+down_revision: str | None = "7b1e4a0c93d2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        UPDATE storage SET is_default = false
+        WHERE is_default AND id NOT IN (
+            SELECT DISTINCT ON (user_id) id FROM storage WHERE is_default ORDER BY user_id, id
+        )
+        """,
+    )
+    op.create_index(
+        "ux_storage_user_default",
+        "storage",
+        ["user_id"],
+        unique=True,
+        postgresql_where=sa.text("is_default"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_storage_user_default", table_name="storage", if_exists=True)
@@ -0,0 +1,35 @@
+"""Order book titles by a coalesced key.
+
+Revision ID: e2c7a95d4b10
+Revises: b6d41f8e2a93
+Create Date: 2026-10-15 23:24:47.902315
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2c7a95d4b10"
+down_revision: str | None = "b6d41f8e2a93"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_books_user_title_key",
+        "books",
+        ["user_id", sa.text("coalesce(title, '')"), "id"],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_index("ix_books_user_title", table_name="books", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index("ix_books_user_title", "books", ["user_id", "title"], unique=False, if_not_exists=True)
+    op.drop_index("ix_books_user_title_key", table_name="books", if_exists=True)
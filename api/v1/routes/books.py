@@ -1,5 +1,4 @@
-from pathlib import Path
-import shutil
+import asyncio
 import uuid
 
 from fastapi import (
@@ -13,10 +12,11 @@ from fastapi import (
     Security,
     UploadFile,
 )
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 
 from api.v1.schemas.book_schemas import (
     BookDisplay,
+    BookListItem,
     BookUpdate,
     BookUploadQueued,
     PaginatedBookResponse,
@@ -25,16 +25,25 @@ from core.auth import get_current_user
 from core.config import settings
 from models.user import User
 from services.book_service import BookService, get_book_service
-from services.storage.storage_backend import StorageFileType
+from services.storage.storage_backend import StorageFileType, STREAM_CHUNK_SIZE
 
 router = APIRouter()
 
 
+class StoredFileResponse(FileResponse):
+    """
+    A `FileResponse` that reads 1 MiB per chunk instead of 64 KiB, cutting the reads and sends per download.
+    Servers implementing the ASGI pathsend extension still hand the file to the kernel without any reads.
+    """
+
+    chunk_size = STREAM_CHUNK_SIZE
+
+
 def get_base_url(request: Request) -> str:
     return str(request.base_url)
 
 
-def construct_book_display(book_data: dict, request: Request) -> BookDisplay:
+def with_book_urls(book_data: dict, request: Request) -> dict:
     base_url = get_base_url(request)
     book_data = book_data.copy()
 
@@ -46,7 +55,16 @@ def construct_book_display(book_data: dict, request: Request) -> BookDisplay:
     else:
         book_data["download_url"] = None
 
-    return BookDisplay(**book_data)
+    return book_data
+
+
+def construct_book_display(book_data: dict, request: Request) -> BookDisplay:
+    return BookDisplay(**with_book_urls(book_data, request))
+
+
+def construct_book_list_item(book_data: dict, request: Request) -> BookListItem:
+    # List rows omit `description` and `identifiers`; the list DTO leaves them out instead of reporting them empty.
+    return BookListItem(**with_book_urls(book_data, request))
 
 
 @router.post(
@@ -70,8 +88,8 @@ async def upload_book(
     temp_file_path = settings.TEMP_FILES_DIR / f"{uuid.uuid4()!s}.{extension}"
     temp_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with Path.open(temp_file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    # The upload is hashed while it is staged, so processing does not read the file again to hash it.
+    file_hash = await asyncio.to_thread(book_service.stage_upload, file.file, temp_file_path)
 
     if not filename:
         raise HTTPException(
@@ -94,6 +112,7 @@ async def upload_book(
         filename,
         user_id,
         book.id,
+        file_hash,
     )
 
     return book
@@ -112,13 +131,19 @@ async def list_books(
     tags: list[str] | None = Query(None),
     sort_by: str = Query("title", pattern="^(title|uploaded_at)$"),
     sort_order: str = Query("asc", pattern="^(asc|desc)$"),
+    cursor: str | None = Query(
+        None,
+        description="Opaque `next_cursor` from the previous page. Takes precedence over `skip`.",
+    ),
     book_service: BookService = Depends(get_book_service),
     user: User = Security(get_current_user),
 ):
     """
     Lists books with pagination, optional search, filtering and sorting.
+    Pass the returned `next_cursor` back as `cursor` to fetch the following page
+    without the cost of skipping over earlier rows.
     """
-    books, total = await book_service.get_books(
+    books, total, next_cursor = await book_service.get_books(
         user.id,
         skip,
         limit,
@@ -126,9 +151,10 @@ async def list_books(
         tags,
         sort_by,
         sort_order,
+        cursor,
     )
-    items = [construct_book_display(book, request) for book in books]
-    return PaginatedBookResponse(items=items, total=total)
+    items = [construct_book_list_item(book, request) for book in books]
+    return PaginatedBookResponse(items=items, total=total, next_cursor=next_cursor)
 
 
 @router.get(
@@ -201,7 +227,6 @@ async def delete_book(
 )
 async def get_book_cover(
     book_id: str,
-    background_tasks: BackgroundTasks,
     variant: str | None = Query(
         None,
         description="Cover variant, e.g., 'thumbnail'",
@@ -226,18 +251,32 @@ async def get_book_cover(
 
     for cover in book.covers:
         if cover["variant"] == variant and book.stored_filename:
-            cover_path = storage_backend.get_file(
+            if not storage_backend.is_local:
+                # Remote covers are relayed as they arrive instead of being downloaded to disk first.
+                cover_stream = await asyncio.to_thread(
+                    storage_backend.open_stream,
+                    user,
+                    book.file_hash,
+                    cover["filename"],
+                    StorageFileType.COVER,
+                )
+
+                if cover_stream:
+                    return StreamingResponse(cover_stream, media_type="image/jpeg")
+
+                continue
+
+            cover_path = await asyncio.to_thread(
+                storage_backend.get_file,
                 user,
                 book.file_hash,
                 cover["filename"],
                 StorageFileType.COVER,
             )
 
-            if cover_path and cover_path.exists():
-                if not storage_backend.is_local:
-                    background_tasks.add_task(cover_path.unlink)
-
-                return FileResponse(cover_path, background=background_tasks)
+            # Backends only return paths of files that exist, so there is nothing left to stat here.
+            if cover_path:
+                return StoredFileResponse(cover_path)
             else:
                 continue
 
@@ -253,7 +292,6 @@ async def get_book_cover(
 )
 async def download_book_file(
     book_id: str,
-    background_tasks: BackgroundTasks,
     book_service: BookService = Depends(get_book_service),
     user: User = Security(get_current_user),
 ):
@@ -266,28 +304,37 @@ async def download_book_file(
         raise HTTPException(status_code=404, detail="File not found.")
 
     storage_backend = await book_service.get_storage_backend(user)
+    filename = book.original_filename or book.stored_filename
+    media_type = book.format or "application/octet-stream"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
 
-    book_path = storage_backend.get_file(
+    if not storage_backend.is_local:
+        # Remote books are relayed as they arrive instead of being downloaded to disk first.
+        book_stream = await asyncio.to_thread(
+            storage_backend.open_stream,
+            user,
+            book.file_hash,
+            book.stored_filename,
+            StorageFileType.BOOK,
+        )
+
+        if not book_stream:
+            raise HTTPException(status_code=404, detail="File not found.")
+
+        return StreamingResponse(book_stream, media_type=media_type, headers=headers)
+
+    book_path = await asyncio.to_thread(
+        storage_backend.get_file,
         user,
         book.file_hash,
         book.stored_filename,
         StorageFileType.BOOK,
     )
 
-    if not book_path or not book_path.exists():
+    if not book_path:
         raise HTTPException(status_code=404, detail="File not found.")
 
-    if not storage_backend.is_local:
-        background_tasks.add_task(book_path.unlink)
-
-    return FileResponse(
-        book_path,
-        filename=book.original_filename or book.stored_filename,
-        media_type=book.format or "application/octet-stream",
-        headers={
-            "Content-Disposition": f'attachment; filename="{book.original_filename or book.stored_filename}"',
-        },
-    )
+    return StoredFileResponse(book_path, filename=filename, media_type=media_type, headers=headers)
 
 
 @router.get(
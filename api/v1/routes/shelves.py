@@ -30,7 +30,7 @@ async def list_shelves(
     user: User = Security(get_current_user),
 ):
     shelves = await shelf_service.list_shelves(user.id)
-    return [ShelfRead(id=s.id, name=s.name, book_ids=[b.id for b in s.books]) for s in shelves]
+    return [ShelfRead(id=s.id, name=s.name, book_ids=book_ids) for s, book_ids in shelves]
 
 
 @router.get(
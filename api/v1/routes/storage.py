@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Security
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.v1.schemas.storage_schemas import (
@@ -14,6 +15,7 @@ from database.storage_crud import (
     delete_storage,
     get_all_storages,
     get_storage_by_id,
+    mark_default_storage,
     update_storage,
 )
 from models.user import User
@@ -70,7 +72,7 @@ async def get_all_storage_records(
     current_user: User = Security(get_current_user),
 ):
     items, total = await get_all_storages(db, current_user.id)
-    items = [StorageRead.model_validate(item.__dict__) for item in items]
+    items = [StorageRead.model_validate(item) for item in items]
     total = int(total or 0)
 
     return PaginatedStorageResponse(items=items, total=total)
@@ -137,17 +139,14 @@ async def set_default_storage(
     if storage is None or storage.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Storage not found.")
 
-    items, _ = await get_all_storages(db, current_user.id, skip=0, limit=1000)
+    try:
+        storage = await mark_default_storage(db, storage)
+    except IntegrityError as error:
+        await db.rollback()
 
-    for item in items:
-        if item.is_default:
-            item.is_default = False
-            db.add(item)
-
-    storage.is_default = True
-    db.add(storage)
-
-    await db.commit()
-    await db.refresh(storage)
+        raise HTTPException(
+            status_code=409,
+            detail="Default storage was changed concurrently.",
+        ) from error
 
-    return StorageRead.model_validate(storage.__dict__)
+    return StorageRead.model_validate(storage)
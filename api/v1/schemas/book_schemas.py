@@ -73,6 +73,35 @@ class BookInDB(BookDisplay):
     covers: list[dict[str, str]] = []
 
 
+class BookListItem(BaseModel):
+    """A book as shown on list pages; `description` and `identifiers` are only returned by `BookDisplay`."""
+
+    id: str
+    title: str | None = None
+    authors: list[AuthorSchema] | None = None
+    publisher: str | None = None
+    publication_date: str | None = None
+    isbn_10: str | None = None
+    isbn_13: str | None = None
+    language: str | None = None
+    series_name: str | None = None
+    series_index: float | None = None
+    tags: list[str] | None = []
+    format: str | None = None
+    file_hash: str | None = None
+    file_path: str | None = None
+    file_size_bytes: int | None = None
+    download_url: HttpUrl | None = None
+    covers: list[dict[str, str]] = []
+    original_filename: str | None = None
+    stored_filename: str | None = None
+    uploaded_at: datetime
+    modified_at: datetime | None = None
+    status: str
+    processing_error: str | None = None
+
+
 class PaginatedBookResponse(BaseModel):
     total: int
-    items: list[BookDisplay]
+    items: list[BookListItem]
+    next_cursor: str | None = None
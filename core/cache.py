@@ -0,0 +1,55 @@
+from collections.abc import Hashable
+import time
+from typing import Any
+
+MISSING = object()
+
+
+class TTLCache:
+    """A small in-process cache whose entries expire a fixed number of seconds after being set."""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """A counter bumped by every invalidation; pass it back to `set` to drop stale values."""
+        return self._generation
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return default
+
+        return value
+
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        # A value read before an invalidation may predate the write that caused it, so it is not cached.
+        if generation is not None and generation != self._generation:
+            return
+
+        self._entries.pop(key, None)
+
+        if len(self._entries) >= self.maxsize:
+            # Dicts keep insertion order, so the first key is the oldest entry.
+            self._entries.pop(next(iter(self._entries)))
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+        self._generation += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._generation += 1
@@ -25,6 +25,17 @@ class Settings(BaseSettings):
     TEST_POSTGRES_DB: str = os.getenv("TEST_POSTGRES_DB", "shelf_test")
     TEST_POSTGRES_HOST: str = os.getenv("TEST_POSTGRES_HOST", "localhost")
     TEST_POSTGRES_PORT: int = int(os.getenv("TEST_POSTGRES_PORT", 5433))
+    DATABASE_POOL_SIZE: int = int(os.getenv("DATABASE_POOL_SIZE", 10))
+    DATABASE_MAX_OVERFLOW: int = int(os.getenv("DATABASE_MAX_OVERFLOW", 10))
+    # Seconds a request waits for a free pooled connection; background ingests hold one for a whole upload.
+    DATABASE_POOL_TIMEOUT: int = int(os.getenv("DATABASE_POOL_TIMEOUT", 30))
+    # Seconds to wait when opening a new connection, so an unreachable server fails fast.
+    DATABASE_CONNECT_TIMEOUT: int = int(os.getenv("DATABASE_CONNECT_TIMEOUT", 3))
+    DATABASE_POOL_RECYCLE: int = int(os.getenv("DATABASE_POOL_RECYCLE", 1800))
+    # Pre-ping costs a round trip per checkout; enable it only where idle connections get dropped
+    # (e.g. behind a proxy or failover) sooner than `DATABASE_POOL_RECYCLE`.
+    DATABASE_POOL_PRE_PING: bool = os.getenv("DATABASE_POOL_PRE_PING", "false").lower() == "true"
+    DATABASE_ECHO: bool = os.getenv("DATABASE_ECHO", "false").lower() == "true"
 
     # Files.
     TEMP_FILES_DIR: Path = Path("./storage/temp")
@@ -32,6 +43,18 @@ class Settings(BaseSettings):
     MINIO_SERVER_HOST: str = os.getenv("MINIO_SERVER_HOST", "localhost")
     MINIO_SERVER_PORT: int = int(os.getenv("MINIO_SERVER_PORT", 9000))
     MINIO_SERVER_PROTOCOL: str = os.getenv("MINIO_SERVER_PROTOCOL", "http")
+    # The SDK defaults to 5 MiB parts and 3 upload threads, which leaves fast links underused for large books.
+    # Files smaller than one part are still sent in a single request.
+    MINIO_UPLOAD_PART_SIZE: int = int(os.getenv("MINIO_UPLOAD_PART_SIZE", 64 * 1024 * 1024))
+    MINIO_UPLOAD_PARALLEL_PARTS: int = int(os.getenv("MINIO_UPLOAD_PARALLEL_PARTS", 8))
+    HASH_WORKERS: int = int(os.getenv("HASH_WORKERS", os.cpu_count() or 1))
+    # Book hashes deduplicate uploads and name their storage directories. Existing libraries
+    # must keep the algorithm they were created with; new ones may prefer "sha256".
+    FILE_HASH_ALGORITHM: str = os.getenv("FILE_HASH_ALGORITHM", "md5")
+    COVER_JPEG_QUALITY: int = int(os.getenv("COVER_JPEG_QUALITY", 85))
+    COVER_ENCODE_WORKERS: int = int(os.getenv("COVER_ENCODE_WORKERS", 0))
+    # Seconds other worker processes may keep using a user's previous default storage after it changes.
+    DEFAULT_STORAGE_CACHE_TTL: int = int(os.getenv("DEFAULT_STORAGE_CACHE_TTL", 5))
 
     # Celery.
     CELERY_BROKER_URL: str | None = None
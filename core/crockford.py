@@ -1,6 +1,7 @@
 import random
 
 CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+CROCKFORD_CHARACTERS = frozenset(CROCKFORD_ALPHABET)
 
 
 def encode_crockford(num: int, length: int = 13) -> str:
@@ -21,3 +22,8 @@ def generate_crockford_id(length: int = 13) -> str:
     """Generate a random Crockford Base32 ID of given length."""
     num = random.SystemRandom().getrandbits(length * 5)
     return encode_crockford(num, length)
+
+
+def is_crockford_id(value: str, length: int = 13) -> bool:
+    """Check whether a string has the shape of an ID produced by `generate_crockford_id`."""
+    return len(value) == length and CROCKFORD_CHARACTERS.issuperset(value)
@@ -0,0 +1,31 @@
+import base64
+import binascii
+from datetime import datetime
+import json
+from typing import Any
+
+
+class InvalidCursorError(ValueError):
+    """Exception raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(sort_value: Any, item_id: str) -> str:
+    """Encode the sort key of the last item on a page into an opaque cursor."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+
+    payload = json.dumps([sort_value, item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[Any, str]:
+    """Decode a cursor produced by `encode_cursor` into its (sort value, ID) pair."""
+    try:
+        sort_value, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as error:
+        raise InvalidCursorError(cursor) from error
+
+    if not isinstance(item_id, str):
+        raise InvalidCursorError(cursor)
+
+    return sort_value, item_id
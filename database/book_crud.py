@@ -1,10 +1,60 @@
-from sqlalchemy import func
+from typing import Any
+
+from sqlalchemy import bindparam, func, insert, literal_column, String, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from api.v1.schemas.book_schemas import BookUpdate
+from core.crockford import generate_crockford_id, is_crockford_id
 from models.domain_models import Book
 
+# Bound once so update paths call straight into pydantic-core instead of going through `model_dump`.
+_dump_book_update = BookUpdate.__pydantic_serializer__.to_python
+
+# Hash lookups run on every ingest; build the statement once and bind values per call.
+BOOK_BY_HASH_QUERY = select(Book).where(Book.file_hash == bindparam("file_hash"))
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE metacharacters so user input only ever matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# Columns of `BookListItem`, rendered by list views; the potentially large `description` text and the
+# `identifiers` array are only returned by the single-book endpoint.
+BOOK_LIST_COLUMNS = (
+    Book.id,
+    Book.user_id,
+    Book.title,
+    Book.authors,
+    Book.publisher,
+    Book.publication_date,
+    Book.isbn_10,
+    Book.isbn_13,
+    Book.language,
+    Book.series_name,
+    Book.series_index,
+    Book.tags,
+    Book.covers,
+    Book.format,
+    Book.original_filename,
+    Book.stored_filename,
+    Book.file_hash,
+    Book.file_path,
+    Book.file_size_bytes,
+    Book.status,
+    Book.processing_error,
+    Book.uploaded_at,
+    Book.modified_at,
+)
+
+# Sort keys must never be NULL: a NULL key fails every keyset comparison, so those rows could not be paged to.
+BOOK_SORT_KEYS = {
+    # Rendered inline rather than bound, so the expression matches `ix_books_user_title_key`.
+    "title": func.coalesce(Book.title, literal_column("''", String)),
+    "uploaded_at": Book.uploaded_at,
+}
+
 
 async def create_book_metadata(
     db: AsyncSession,
@@ -19,19 +69,57 @@ async def create_book_metadata(
     return book
 
 
+async def create_books_bulk(
+    db: AsyncSession,
+    books_data: list[dict],
+) -> list[str]:
+    """Insert many books in a single executemany round trip.
+
+    Rows are not re-read after the insert; only the generated IDs are returned.
+    `render_nulls` keeps `None` values in the statement so rows with the same keys
+    (such as those from `ParsedBatch.to_rows`) are sent as one batch. Rows must describe
+    books whose files are already stored; see `BookService.import_books`.
+    """
+    if not books_data:
+        return []
+
+    rows = [{"id": generate_crockford_id(), **book_data} for book_data in books_data]
+    await db.execute(insert(Book).execution_options(render_nulls=True), rows)
+    await db.commit()
+
+    return [row["id"] for row in rows]
+
+
+async def get_existing_file_hashes(
+    db: AsyncSession,
+    file_hashes: list[str],
+) -> set[str]:
+    """Return which of `file_hashes` already belong to a book, in a single query."""
+    if not file_hashes:
+        return set()
+
+    result = await db.execute(select(Book.file_hash).where(Book.file_hash.in_(file_hashes)))
+    return set(result.scalars())
+
+
 async def get_book_by_id(
     db: AsyncSession,
     book_id: str,
 ) -> Book | None:
-    result = await db.execute(select(Book).where(Book.id == book_id))
-    return result.scalar_one_or_none()
+    # Malformed IDs can never match a row, so skip the round trip entirely.
+    if not is_crockford_id(book_id):
+        return None
+
+    # `Session.get` answers from the identity map when the book is already loaded in this
+    # session, so the repeated lookups during ingest and update flows skip the round trip.
+    return await db.get(Book, book_id)
 
 
 async def get_book_by_hash(
     db: AsyncSession,
     file_hash: str,
 ) -> Book | None:
-    result = await db.execute(select(Book).where(Book.file_hash == file_hash))
+    result = await db.execute(BOOK_BY_HASH_QUERY, {"file_hash": file_hash})
     return result.scalar_one_or_none()
 
 
@@ -44,29 +132,44 @@ async def get_all_books(
     tags: list[str] | None = None,
     sort_by: str = "title",
     sort_order: str = "asc",
+    after: tuple[Any, str] | None = None,
 ):
-    query = select(Book).where(Book.user_id == user_id)
+    """List a user's books as rows of `BOOK_LIST_COLUMNS`.
+
+    Pagination uses `skip` or, when `after` is given, a keyset.
+
+    `after` is the (sort value, ID) pair of the last book on the previous page. Keyset
+    pages seek straight to that position in the index instead of walking `skip` rows.
+    """
+    filters = [Book.user_id == user_id]
 
     if search_query:
-        query = query.where(Book.title.ilike(f"%{search_query}%"))
+        # Case-insensitive substring match, served by the `ix_books_title_trgm` trigram index.
+        filters.append(Book.title.ilike(f"%{escape_like(search_query)}%", escape="\\"))
 
     if tags:
-        for tag in tags:
-            query = query.where(Book.tags.any(tag))
+        # Single `tags @> ARRAY[...]` probe against the GIN index instead of one ANY() per tag.
+        filters.append(Book.tags.contains(tags))
 
-    sort_column = getattr(Book, sort_by, Book.title)
-    sort_column = sort_column.desc() if sort_order.lower() == "desc" else sort_column.asc()
+    sort_column = BOOK_SORT_KEYS.get(sort_by, BOOK_SORT_KEYS["title"])
+    descending = sort_order.lower() == "desc"
+    query = select(*BOOK_LIST_COLUMNS).where(*filters)
 
-    result = await db.execute(query.order_by(sort_column).offset(skip).limit(limit))
-    books = result.scalars().all()
-    count_query = select(func.count()).select_from(Book).where(Book.user_id == user_id)
+    if after is not None:
+        # Book ID breaks ties between equal sort values so no row is skipped or repeated.
+        position = tuple_(sort_column, Book.id)
+        query = query.where(position < after if descending else position > after)
+    else:
+        query = query.offset(skip)
 
-    if search_query:
-        count_query = count_query.where(Book.title.ilike(f"%{search_query}%"))
+    if descending:
+        query = query.order_by(sort_column.desc(), Book.id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), Book.id.asc())
 
-    if tags:
-        for tag in tags:
-            count_query = count_query.where(Book.tags.any(tag))
+    result = await db.execute(query.limit(limit))
+    books = result.all()
+    count_query = select(func.count()).select_from(Book).where(*filters)
 
     count = await db.scalar(count_query)
 
@@ -86,7 +189,7 @@ async def update_book_metadata(
     if isinstance(book_update_data, dict):
         update_data = book_update_data
     else:
-        update_data = book_update_data.model_dump(exclude_unset=True)
+        update_data = _dump_book_update(book_update_data, exclude_unset=True)
 
     for field, value in update_data.items():
         setattr(book, field, value)
@@ -96,6 +199,21 @@ async def update_book_metadata(
     return book
 
 
+async def update_book_status(
+    db: AsyncSession,
+    book_id: str,
+    status: str,
+    error: str | None = None,
+) -> bool:
+    """Set a book's processing status in a single `UPDATE`, without loading the row first."""
+    result = await db.execute(
+        update(Book).where(Book.id == book_id).values(status=status, processing_error=error),
+    )
+    await db.commit()
+
+    return result.rowcount > 0
+
+
 async def delete_book_metadata(db: AsyncSession, book_id: str) -> int:
     book = await get_book_by_id(db, book_id)
 
@@ -1,10 +1,11 @@
+from sqlalchemy import delete, exists, func, literal, String
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, raiseload, selectinload
 
 from core.crockford import generate_crockford_id
-from models.book import Book
-from models.shelf import Shelf
+from models.shelf import Shelf, shelf_books
 
 
 async def create_shelf(db: AsyncSession, user_id: str, name: str) -> Shelf:
@@ -15,40 +16,81 @@ async def create_shelf(db: AsyncSession, user_id: str, name: str) -> Shelf:
     return shelf
 
 
-async def get_shelves(db: AsyncSession, user_id: str) -> list[Shelf]:
+async def get_shelves(db: AsyncSession, user_id: str) -> list[tuple[Shelf, list[str]]]:
+    # Listing only needs book IDs, so aggregate them from the association table
+    # instead of loading every book row on every shelf.
+    book_ids = func.array_remove(func.array_agg(shelf_books.c.book_id), None, type_=ARRAY(String))
+
     result = await db.execute(
-        select(Shelf).where(Shelf.user_id == user_id).options(selectinload(Shelf.books)),
+        select(Shelf, book_ids)
+        .outerjoin(shelf_books, shelf_books.c.shelf_id == Shelf.id)
+        .where(Shelf.user_id == user_id)
+        .group_by(Shelf.id)
+        .options(raiseload("*")),
     )
-    return result.scalars().all()
+    return [(shelf, list(ids or [])) for shelf, ids in result.all()]
 
 
 async def get_shelf(
     db: AsyncSession,
     shelf_id: str,
     user_id: str,
+    load_books: bool = True,
 ) -> Shelf | None:
+    """Fetch a user's shelf; with `load_books=False` its books are left unloaded until explicitly refreshed."""
+    books_loader = selectinload(Shelf.books) if load_books else lazyload(Shelf.books)
+
     result = await db.execute(
-        select(Shelf).where(Shelf.id == shelf_id, Shelf.user_id == user_id).options(selectinload(Shelf.books)),
+        select(Shelf).where(Shelf.id == shelf_id, Shelf.user_id == user_id).options(books_loader),
     )
     return result.scalars().first()
 
 
-async def delete_shelf(db: AsyncSession, shelf: Shelf) -> None:
-    await db.delete(shelf)
+async def delete_shelf(db: AsyncSession, shelf_id: str, user_id: str) -> bool:
+    """Delete a user's shelf in one statement, returning whether it existed.
+
+    Its `shelf_books` rows go with it through the `ON DELETE CASCADE` foreign key.
+    """
+    result = await db.execute(
+        delete(Shelf).where(Shelf.id == shelf_id, Shelf.user_id == user_id).returning(Shelf.id),
+    )
+    deleted = result.first() is not None
     await db.commit()
 
+    return deleted
 
-async def add_book(db: AsyncSession, shelf: Shelf, book: Book) -> Shelf:
-    if book not in shelf.books:
-        shelf.books.append(book)
-        await db.commit()
-        await db.refresh(shelf)
-    return shelf
 
+async def add_book(db: AsyncSession, shelf_id: str, user_id: str, book_id: str) -> bool:
+    """Put a book on a user's shelf in one statement.
 
-async def remove_book(db: AsyncSession, shelf: Shelf, book: Book) -> Shelf:
-    if book in shelf.books:
-        shelf.books.remove(book)
-        await db.commit()
-        await db.refresh(shelf)
-    return shelf
+    Returns `False` when nothing was added, because the shelf is not the user's or already holds the book.
+    """
+    owned_shelf = select(Shelf.id, literal(book_id, String)).where(Shelf.id == shelf_id, Shelf.user_id == user_id)
+
+    result = await db.execute(
+        insert(shelf_books)
+        .from_select(["shelf_id", "book_id"], owned_shelf)
+        .on_conflict_do_nothing()
+        .returning(shelf_books.c.book_id),
+    )
+    added = result.first() is not None
+    await db.commit()
+
+    return added
+
+
+async def remove_book(db: AsyncSession, shelf_id: str, user_id: str, book_id: str) -> bool:
+    """Take a book off a user's shelf in one statement, returning `False` when it was not there."""
+    result = await db.execute(
+        delete(shelf_books)
+        .where(
+            shelf_books.c.shelf_id == shelf_id,
+            shelf_books.c.book_id == book_id,
+            exists().where(Shelf.id == shelf_id, Shelf.user_id == user_id),
+        )
+        .returning(shelf_books.c.book_id),
+    )
+    removed = result.first() is not None
+    await db.commit()
+
+    return removed
@@ -1,11 +1,37 @@
-from sqlalchemy import func
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from core.cache import MISSING, TTLCache
+from core.config import settings
 from core.crockford import generate_crockford_id
 from models.storage import Storage
 
 
+@dataclass(frozen=True, slots=True)
+class StorageSnapshot:
+    """The fields needed to build a storage backend, detached from any session so it can be cached."""
+
+    id: str
+    storage_type: str
+    config: dict[str, Any]
+
+
+# Default storage rows are read on every upload, download and delete but change rarely.
+# Entries are invalidated on writes in this process only: other worker processes keep resolving
+# the previous default until the TTL expires. Books do not record which storage holds their
+# files, so keep the TTL short; within that window, uploads in another process may still go
+# to the old backend while downloads here already read from the new one.
+default_storage_cache = TTLCache(ttl=settings.DEFAULT_STORAGE_CACHE_TTL)
+
+
+def invalidate_default_storage(user_id: str) -> None:
+    default_storage_cache.invalidate(user_id)
+
+
 async def create_storage(
     db: AsyncSession,
     storage_data: dict,
@@ -16,6 +42,7 @@ async def create_storage(
 
     await db.commit()
     await db.refresh(storage)
+    invalidate_default_storage(storage.user_id)
 
     return storage
 
@@ -48,12 +75,57 @@ async def get_all_storages(
 async def get_default_storage(
     db: AsyncSession,
     user_id: str,
-) -> Storage | None:
+) -> StorageSnapshot | None:
+    storage = default_storage_cache.get(user_id)
+
+    if storage is not MISSING:
+        return storage
+
+    # Taken before the query, so a default changed while it runs is not cached from the stale read.
+    generation = default_storage_cache.generation
+
+    # Plain columns rather than a mapped `Storage`: a cached instance would stay bound to the
+    # session that loaded it and break once that session rolls back or closes.
     result = await db.execute(
-        select(Storage).where(Storage.is_default & (Storage.user_id == user_id)),
+        select(Storage.id, Storage.storage_type, Storage.config).where(
+            Storage.is_default & (Storage.user_id == user_id),
+        ),
     )
 
-    return result.scalar_one_or_none()
+    row = result.one_or_none()
+    storage = StorageSnapshot(row.id, row.storage_type, dict(row.config or {})) if row else None
+    default_storage_cache.set(user_id, storage, generation)
+
+    return storage
+
+
+async def mark_default_storage(
+    db: AsyncSession,
+    storage: Storage,
+) -> Storage:
+    """Make `storage` the user's default, clearing the previous default in the same transaction.
+
+    Raises:
+        IntegrityError: If another default was set concurrently (`ux_storage_user_default`).
+    """
+    await db.execute(
+        update(Storage)
+        .where(Storage.user_id == storage.user_id, Storage.is_default, Storage.id != storage.id)
+        .values(is_default=False)
+        .execution_options(synchronize_session=False),
+    )
+
+    # Flushed on commit, after the previous default has been cleared.
+    storage.is_default = True
+
+    try:
+        await db.commit()
+    finally:
+        invalidate_default_storage(storage.user_id)
+
+    await db.refresh(storage)
+
+    return storage
 
 
 async def update_storage(
@@ -71,6 +143,7 @@ async def update_storage(
 
     await db.commit()
     await db.refresh(storage)
+    invalidate_default_storage(storage.user_id)
 
     return storage
 
@@ -86,3 +159,4 @@ async def delete_storage(
 
     await db.delete(storage)
     await db.commit()
+    invalidate_default_storage(storage.user_id)
@@ -4,12 +4,14 @@ from pathlib import Path
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
 
 from api.v1.routes import auth as auth_v1_router
 from api.v1.routes import books as books_v1_router
 from api.v1.routes import shelves as shelves_v1_router
 from api.v1.routes import storage as storage_v1_router
 from core.config import settings
+from database import engine
 
 load_dotenv()
 
@@ -17,7 +19,13 @@ load_dotenv()
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     Path(settings.BOOK_FILES_DIR).mkdir(parents=True, exist_ok=True)
+
+    # Open a pooled connection up front so the first request does not pay for the handshake.
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
     yield
+    await engine.dispose()
 
 
 app = FastAPI(
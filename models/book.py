@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import ARRAY, JSON
 from sqlalchemy.ext.mutable import MutableList
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -17,6 +17,14 @@ if TYPE_CHECKING:
 class Book(Base):
     __tablename__ = "books"
 
+    __table_args__ = (
+        # Title listings order by `coalesce(title, '')` so untitled books stay reachable by keyset cursors.
+        Index("ix_books_user_title_key", "user_id", text("coalesce(title, '')"), "id"),
+        # Trigrams let `title ILIKE '%term%'` searches use an index (requires the `pg_trgm` extension).
+        Index("ix_books_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_books_tags_gin", "tags", postgresql_using="gin"),
+    )
+
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
     title: Mapped[str | None] = mapped_column(String, nullable=True)
 
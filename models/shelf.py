@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, Table
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -16,6 +16,8 @@ shelf_books = Table(
     Base.metadata,
     Column("shelf_id", String, ForeignKey("shelves.id", ondelete="CASCADE"), primary_key=True),
     Column("book_id", String, ForeignKey("books.id", ondelete="CASCADE"), primary_key=True),
+    # The primary key only serves lookups by shelf; this one serves lookups by book.
+    Index("ix_shelf_books_book_shelf", "book_id", "shelf_id"),
 )
 
 
@@ -32,8 +34,12 @@ class Shelf(Base):
         nullable=False,
     )
 
+    # Loaded with one `IN` query per batch of shelves rather than one query per shelf, which
+    # also keeps attribute access safe under asyncio where implicit lazy loads cannot run.
+    # Queries that only need book IDs should override this with `raiseload`.
     books: Mapped[list[Book]] = relationship(
         "Book",
         secondary="shelf_books",
         back_populates="shelves",
+        lazy="selectin",
     )
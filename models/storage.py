@@ -1,6 +1,7 @@
 from typing import Any
 
-from sqlalchemy import Boolean, ForeignKey, JSON, String
+from sqlalchemy import Boolean, ForeignKey, Index, String, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from database.base import Base
@@ -9,6 +10,12 @@ from database.base import Base
 class Storage(Base):
     __tablename__ = "storage"
 
+    __table_args__ = (
+        # Enforces at most one default storage per user in the database itself.
+        Index("ux_storage_user_default", "user_id", unique=True, postgresql_where=text("is_default")),
+        Index("ix_storage_config_gin", "config", postgresql_using="gin"),
+    )
+
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
 
     title: Mapped[str] = mapped_column(
@@ -17,7 +24,7 @@ class Storage(Base):
         nullable=True,
     )
 
-    config: Mapped[Any] = mapped_column(JSON, nullable=False)
+    config: Mapped[Any] = mapped_column(JSONB, nullable=False)
     storage_type: Mapped[str] = mapped_column(String, nullable=False)
 
     user_id: Mapped[str] = mapped_column(
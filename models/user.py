@@ -1,9 +1,10 @@
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 from sqlalchemy import Boolean, DateTime, String
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
 
 from database.base import Base
 
@@ -11,6 +12,9 @@ from database.base import Base
 class User(Base):
     __tablename__ = "users"
 
+    # Fetch server-generated timestamps via RETURNING instead of expiring them after flush.
+    __mapper_args__: ClassVar[dict[str, Any]] = {"eager_defaults": True}
+
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
 
     username: Mapped[str] = mapped_column(
@@ -23,12 +27,12 @@ class User(Base):
     email: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
     password: Mapped[str] = mapped_column(String, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.now,
-        onupdate=datetime.now,
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
     api_key_hash: Mapped[str | None] = mapped_column(
@@ -38,4 +42,4 @@ class User(Base):
         nullable=True,
     )
 
-    preferences: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)
+    preferences: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
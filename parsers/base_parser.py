@@ -1,6 +1,37 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+import functools
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
+
+EXTENSION_FORMATS = {
+    ".epub": "EPUB",
+    ".pdf": "PDF",
+    ".mobi": "MOBI/AZW",
+    ".azw": "MOBI/AZW",
+    ".azw3": "MOBI/AZW",
+}
+
+
+class Author(NamedTuple):
+    name: str
+
+
+class Identifier(NamedTuple):
+    type: str
+    value: str
+
+
+def as_records(values: Iterable[NamedTuple]) -> list[dict[str, Any]]:
+    """Convert parsed authors or identifiers into the dicts stored in the `books` JSON columns."""
+    return [value._asdict() for value in values]
+
+
+def format_for(file_path: str | os.PathLike[str]) -> str | None:
+    """Identify a file format from its extension, accepting plain string paths without building a `Path`."""
+    extension = os.path.splitext(file_path)[1]  # noqa: PTH122 - avoids constructing a Path per lookup
+    return EXTENSION_FORMATS.get(extension.lower())
 
 
 class BookParser(ABC):
@@ -17,17 +48,34 @@ class BookParser(ABC):
         """
         pass
 
+    def parse(self, file_path: Path) -> tuple[dict[str, Any], tuple[bytes, str] | None]:
+        """
+        Extracts both the metadata and the cover image data.
+        Parsers that can share work between the two should override this.
+        """
+        return self.parse_metadata(file_path), self.extract_cover_image_data(file_path)
+
     @staticmethod
     def get_file_format(file_path: Path) -> str | None:
         """Attempt to identify file format based on extension."""
-        extension = file_path.suffix.lower()
-
-        match extension:
-            case ".epub":
-                return "EPUB"
-            case ".pdf":
-                return "PDF"
-            case ".mobi" | ".azw" | ".azw3":
-                return "MOBI/AZW"
-            case _:
-                return None
+        return format_for(file_path)
+
+
+@functools.cache
+def get_parser(file_format: str) -> BookParser | None:
+    """
+    Return the shared parser for a format, or `None` when it is not supported; parsers keep no per-file state.
+    This is the single format registry for uploads and batch workers. Parser modules load heavy
+    native libraries (PyMuPDF alone takes ~100 ms to import), so each is imported on first use.
+    """
+    if file_format == "EPUB":
+        from .epub_parser import EpubParser
+
+        return EpubParser()
+
+    if file_format == "PDF":
+        from .pdf_parser import PdfParser
+
+        return PdfParser()
+
+    return None
@@ -0,0 +1,61 @@
+"""Parse many book files in parallel worker processes."""
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+from pathlib import Path
+from typing import Any
+
+from .base_parser import format_for, get_parser
+from .columnar import ParsedBatch
+
+ParseResult = tuple[dict[str, Any], tuple[bytes, str] | None]
+
+
+def parse_one(file_path: Path) -> ParseResult | None:
+    """Parse a single file, returning `None` when its format is not supported."""
+    file_format = format_for(file_path)
+    # `get_parser` is cached, so each worker process reuses one instance per format.
+    parser = get_parser(file_format) if file_format else None
+
+    if parser is None:
+        return None
+
+    return parser.parse(file_path)
+
+
+def parse_many(
+    file_paths: Iterable[Path],
+    max_workers: int | None = None,
+    chunksize: int = 8,
+) -> Iterator[tuple[Path, ParseResult | None]]:
+    """
+    Parse files across a process pool, yielding `(path, result)` pairs in input order.
+    Parsing is CPU-bound (inflate, XML, rasterization), so workers sidestep the GIL.
+    Results stream back as they complete so callers can insert them in batches;
+    database sessions must stay in the calling process.
+    Forkserver workers are not forked from the caller, so they inherit none of its threads or connections.
+    """
+    file_paths = list(file_paths)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        mp_context=multiprocessing.get_context("forkserver"),
+    ) as executor:
+        yield from zip(file_paths, executor.map(parse_one, file_paths, chunksize=chunksize), strict=True)
+
+
+def parse_batch(
+    file_paths: Iterable[Path],
+    max_workers: int | None = None,
+    chunksize: int = 8,
+) -> ParsedBatch:
+    """Parse files in parallel into a column-oriented `ParsedBatch`, skipping unsupported formats."""
+    batch = ParsedBatch()
+
+    for file_path, result in parse_many(file_paths, max_workers=max_workers, chunksize=chunksize):
+        if result is not None:
+            batch.append(file_path, *result)
+
+    return batch
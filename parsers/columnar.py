@@ -0,0 +1,94 @@
+"""Column-oriented container for the results of a bulk parse."""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .base_parser import as_records, format_for
+
+# Columns that parsing cannot fill: they describe the stored file and the book's state.
+# Rows without them would insert books that stay "queued" with no file behind them.
+STORED_BOOK_COLUMNS = frozenset(
+    {"file_hash", "file_path", "stored_filename", "file_size_bytes", "covers", "status", "user_id"},
+)
+
+
+@dataclass
+class ParsedBatch:
+    """
+    Parsed books stored as one list per field rather than one dict per book.
+    Row `i` of every list describes `file_paths[i]`; files in unsupported formats are skipped.
+    """
+
+    file_paths: list[Path] = field(default_factory=list)
+    titles: list[str | None] = field(default_factory=list)
+    authors: list[list[dict[str, Any]]] = field(default_factory=list)
+    publishers: list[str | None] = field(default_factory=list)
+    publication_dates: list[str | None] = field(default_factory=list)
+    languages: list[str | None] = field(default_factory=list)
+    descriptions: list[str | None] = field(default_factory=list)
+    tags: list[list[str]] = field(default_factory=list)
+    identifiers: list[list[dict[str, Any]]] = field(default_factory=list)
+    formats: list[str | None] = field(default_factory=list)
+    parsing_errors: list[str | None] = field(default_factory=list)
+    covers: list[tuple[bytes, str] | None] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.file_paths)
+
+    def append(
+        self,
+        file_path: Path,
+        metadata: dict[str, Any],
+        cover: tuple[bytes, str] | None,
+    ) -> None:
+        self.file_paths.append(file_path)
+        self.titles.append(metadata.get("title") or file_path.name)
+        self.authors.append(as_records(metadata.get("authors", ())))
+        self.publishers.append(metadata.get("publisher"))
+        self.publication_dates.append(metadata.get("publication_date"))
+        self.languages.append(metadata.get("language"))
+        self.descriptions.append(metadata.get("description"))
+        self.tags.append(metadata.get("tags", []))
+        self.identifiers.append(as_records(metadata.get("identifiers", ())))
+        # A file that failed to parse still has the format its extension was dispatched on.
+        self.formats.append(metadata.get("format") or format_for(file_path))
+        self.parsing_errors.append(metadata.get("parsing_error"))
+        self.covers.append(cover)
+
+    def to_rows(
+        self,
+        indices: Sequence[int],
+        columns: Mapping[str, Sequence[Any]],
+        **common: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Build `books` insert parameters for the parsed books at `indices`.
+        Parsing only yields metadata, so every key of `STORED_BOOK_COLUMNS` must come from either
+        `columns` (one value per entry of `indices`) or `common` (shared by every row, e.g. `user_id`).
+        Every row carries the same keys so the whole batch goes out as a single executemany.
+        """
+        missing = STORED_BOOK_COLUMNS - columns.keys() - common.keys()
+
+        if missing:
+            message = f"Missing stored book columns: {', '.join(sorted(missing))}."
+            raise ValueError(message)
+
+        return [
+            {
+                "title": self.titles[i],
+                "authors": self.authors[i],
+                "publisher": self.publishers[i],
+                "publication_date": self.publication_dates[i],
+                "language": self.languages[i],
+                "description": self.descriptions[i],
+                "tags": self.tags[i],
+                "identifiers": self.identifiers[i],
+                "format": self.formats[i],
+                "original_filename": self.file_paths[i].name,
+                **{name: values[position] for name, values in columns.items()},
+                **common,
+            }
+            for position, i in enumerate(indices)
+        ]
@@ -1,83 +1,249 @@
 from pathlib import Path
+import posixpath
+import re
 from typing import Any
+from urllib.parse import unquote
+import zipfile
 
-from bs4 import BeautifulSoup
 import ebooklib
 from ebooklib import epub
+from lxml import etree
+import lxml.html
 
 from core.logger import logger
 
-from .base_parser import BookParser
+from .base_parser import Author, BookParser, Identifier
+
+CONTAINER_PATH = "META-INF/container.xml"
+
+NAMESPACES = {
+    "container": "urn:oasis:names:tc:opendocument:xmlns:container",
+    "opf": "http://www.idpf.org/2007/opf",
+    "dc": "http://purl.org/dc/elements/1.1/",
+}
+
+OPF_SCHEME_ATTRIBUTE = f"{{{NAMESPACES['opf']}}}scheme"
+
+# Streaming OPF metadata reads only need Dublin Core elements and the end of the metadata block.
+DC_ELEMENT_TAG = f"{{{NAMESPACES['dc']}}}*"
+OPF_METADATA_TAG = f"{{{NAMESPACES['opf']}}}metadata"
+
+# Cover declarations in the OPF manifest, in order of preference: the EPUB 3 `cover-image`
+# property, the EPUB 2 `<meta name="cover">` pointer, then an image named like a cover.
+COVER_IMAGE_ITEM_XPATH = etree.XPath(
+    "//opf:manifest/opf:item[contains(concat(' ', normalize-space(@properties), ' '), ' cover-image ')]",
+    namespaces=NAMESPACES,
+)
+COVER_META_ITEM_XPATH = etree.XPath(
+    "//opf:manifest/opf:item[@id = //opf:metadata/opf:meta[@name = 'cover']/@content]",
+    namespaces=NAMESPACES,
+)
+IMAGE_ITEMS_XPATH = etree.XPath(
+    "//opf:manifest/opf:item[starts-with(@media-type, 'image/')]",
+    namespaces=NAMESPACES,
+)
+
+# Archive contents are untrusted: never resolve entities or fetch external resources.
+XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+
+# Everything that cannot appear in an ISBN-10 or ISBN-13 (digits, plus the X check digit).
+ISBN_STRIP_PATTERN = re.compile(r"[^0-9Xx]")
+
+
+def html_to_text(markup: str) -> str:
+    """Return the text content of an HTML fragment."""
+    # Most descriptions are plain text without tags or entities, which needs no parsing at all.
+    if "<" not in markup and "&" not in markup:
+        return markup
+
+    try:
+        return lxml.html.fromstring(markup).text_content()
+    except etree.ParserError:
+        # Markup without any content, such as a lone comment.
+        return ""
+
+
+def find_opf_path(archive: zipfile.ZipFile) -> str:
+    """
+    Return the archive path of the OPF package document declared in the EPUB container.
+    Archives with a missing or malformed container fall back to the first `.opf` member listed
+    in the zip's central directory, which is read without inflating anything.
+    """
+    try:
+        container = etree.fromstring(archive.read(CONTAINER_PATH), XML_PARSER)
+        return container.xpath("//container:rootfile/@full-path", namespaces=NAMESPACES)[0]
+    except (KeyError, IndexError, etree.XMLSyntaxError):
+        opf_path = next((name for name in archive.namelist() if name.lower().endswith(".opf")), None)
+
+        if opf_path is None:
+            raise
+
+        return opf_path
+
+
+def read_package(archive: zipfile.ZipFile) -> tuple[etree._Element, str]:
+    """Parse the OPF package document of an open EPUB archive, returning it with its archive path."""
+    opf_path = find_opf_path(archive)
+    return etree.fromstring(archive.read(opf_path), XML_PARSER), opf_path
+
+
+def read_dc_metadata(archive: zipfile.ZipFile, opf_path: str) -> dict[str, list[etree._Element]]:
+    """
+    Stream the OPF package document of an open EPUB and group its Dublin Core elements by local tag name.
+    Unlike `epub.read_epub`, no other archive member is read, and parsing stops at the end of
+    the metadata block, so the manifest and spine are never built into elements.
+    """
+    elements: dict[str, list[etree._Element]] = {}
+
+    with archive.open(opf_path) as opf_file:
+        events = etree.iterparse(
+            opf_file,
+            events=("end",),
+            tag=(DC_ELEMENT_TAG, OPF_METADATA_TAG),
+            resolve_entities=False,
+            no_network=True,
+        )
+
+        for _, element in events:
+            if element.tag == OPF_METADATA_TAG:
+                break
+
+            elements.setdefault(etree.QName(element).localname, []).append(element)
+
+    return elements
+
+
+def package_dc_metadata(opf: etree._Element) -> dict[str, list[etree._Element]]:
+    """Group the Dublin Core elements of an already parsed OPF package document like `read_dc_metadata`."""
+    metadata = opf.find(OPF_METADATA_TAG)
+    elements: dict[str, list[etree._Element]] = {}
+
+    for element in (opf if metadata is None else metadata).iter(DC_ELEMENT_TAG):
+        elements.setdefault(etree.QName(element).localname, []).append(element)
+
+    return elements
+
+
+def find_cover_item(opf: etree._Element) -> etree._Element | None:
+    """Return the manifest item declared or named as the cover image, if any."""
+    for item in COVER_IMAGE_ITEM_XPATH(opf) + COVER_META_ITEM_XPATH(opf):
+        if item.get("media-type", "").startswith("image/"):
+            return item
+
+    for item in IMAGE_ITEMS_XPATH(opf):
+        if "cover" in posixpath.basename(item.get("href", "")).lower():
+            return item
+
+    return None
+
+
+def read_package_cover(archive: zipfile.ZipFile, opf: etree._Element, opf_path: str) -> tuple[bytes, str] | None:
+    """Read the cover image declared in the OPF manifest, or return `None` when the manifest names none."""
+    cover_item = find_cover_item(opf)
+
+    if cover_item is None:
+        return None
+
+    # Manifest hrefs are relative to the OPF document and may be URL-encoded.
+    href = unquote(cover_item.get("href", ""))
+    cover_path = posixpath.normpath(posixpath.join(posixpath.dirname(opf_path), href))
+    return archive.read(cover_path), cover_item.get("media-type")
 
 
 class EpubParser(BookParser):
+    def parse(self, file_path: Path) -> tuple[dict[str, Any], tuple[bytes, str] | None]:
+        # Open the archive and parse the package document once for both the metadata and the cover.
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                opf, opf_path = read_package(archive)
+                metadata = self._parse_dc_metadata(file_path, package_dc_metadata(opf))
+
+                try:
+                    cover = read_package_cover(archive, opf, opf_path)
+                except KeyError as e:
+                    logger.warning(f"Could not locate EPUB cover from the manifest of {file_path}: {e}")
+                    cover = None
+        except Exception as e:
+            logger.error(f"Error parsing EPUB metadata for {file_path}: {e}")
+            return {"parsing_error": str(e)}, self._read_fallback_cover(file_path)
+
+        return metadata, cover or self._read_fallback_cover(file_path)
+
     def parse_metadata(self, file_path: Path) -> dict[str, Any]:
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                dc = read_dc_metadata(archive, find_opf_path(archive))
+        except Exception as e:
+            logger.error(f"Error parsing EPUB metadata for {file_path}: {e}")
+            return {"parsing_error": str(e)}
+
+        return self._parse_dc_metadata(file_path, dc)
+
+    def _parse_dc_metadata(self, file_path: Path, dc: dict[str, list[etree._Element]]) -> dict[str, Any]:
         metadata = {}
 
         try:
-            book = epub.read_epub(str(file_path))
-            titles = book.get_metadata("DC", "title")
+            titles = dc.get("title")
 
             if titles:
-                metadata["title"] = titles[0][0]
+                metadata["title"] = titles[0].text
 
-            creators = book.get_metadata("DC", "creator")
+            creators = dc.get("creator")
 
             if creators:
-                metadata["authors"] = [{"name": c[0]} for c in creators]
+                metadata["authors"] = [Author(c.text) for c in creators if c.text]
 
-            languages = book.get_metadata("DC", "language")
+            languages = dc.get("language")
 
             if languages:
-                metadata["language"] = languages[0][0]
+                metadata["language"] = languages[0].text
 
             identifiers = []
-            identifiers_meta = book.get_metadata("DC", "identifier")
+            identifiers_meta = dc.get("identifier", ())
 
             for id_meta in identifiers_meta:
-                value = id_meta[0]
+                value = id_meta.text
+
+                if not value:
+                    continue
 
-                scheme = (
-                    id_meta[1].get("scheme", "UNKNOWN").upper()
-                    if len(id_meta) > 1 and isinstance(id_meta[1], dict)
-                    else "UNKNOWN"
-                )
+                scheme = (id_meta.get(OPF_SCHEME_ATTRIBUTE) or id_meta.get("scheme") or "UNKNOWN").upper()
 
                 if "ISBN" in scheme:
-                    cleaned_isbn = "".join(filter(str.isalnum, value))
+                    cleaned_isbn = ISBN_STRIP_PATTERN.sub("", value).upper()
+                    isbn_length = len(cleaned_isbn)
 
-                    if len(cleaned_isbn) == 10:
-                        identifiers.append({"type": "ISBN_10", "value": cleaned_isbn})
-                    elif len(cleaned_isbn) == 13:
-                        identifiers.append({"type": "ISBN_13", "value": cleaned_isbn})
+                    if isbn_length == 10:
+                        identifiers.append(Identifier("ISBN_10", cleaned_isbn))
+                    elif isbn_length == 13:
+                        identifiers.append(Identifier("ISBN_13", cleaned_isbn))
                     else:
-                        identifiers.append({"type": scheme, "value": value})
+                        identifiers.append(Identifier(scheme, value))
                 else:
-                    identifiers.append({"type": scheme, "value": value})
+                    identifiers.append(Identifier(scheme, value))
 
             if identifiers:
                 metadata["identifiers"] = identifiers
 
-            publishers = book.get_metadata("DC", "publisher")
+            publishers = dc.get("publisher")
 
             if publishers:
-                metadata["publisher"] = publishers[0][0]
+                metadata["publisher"] = publishers[0].text
 
-            dates = book.get_metadata("DC", "date")
+            dates = dc.get("date")
 
             if dates:
-                metadata["publication_date"] = dates[0][0]
+                metadata["publication_date"] = dates[0].text
 
-            descriptions = book.get_metadata("DC", "description")
+            descriptions = dc.get("description")
 
-            if descriptions:
-                soup = BeautifulSoup(descriptions[0][0], "html.parser")
-                metadata["description"] = soup.get_text()
+            if descriptions and descriptions[0].text:
+                metadata["description"] = html_to_text(descriptions[0].text)
 
-            subjects = book.get_metadata("DC", "subject")
+            subjects = dc.get("subject")
 
             if subjects:
-                metadata["tags"] = [s[0] for s in subjects]
+                metadata["tags"] = [s.text for s in subjects if s.text]
 
             metadata["format"] = "EPUB"
         except Exception as e:
@@ -87,12 +253,33 @@ class EpubParser(BookParser):
         return metadata
 
     def extract_cover_image_data(self, file_path: Path) -> tuple[bytes, str] | None:
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                opf, opf_path = read_package(archive)
+                cover = read_package_cover(archive, opf, opf_path)
+        except (KeyError, IndexError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+            logger.warning(f"Could not locate EPUB cover from the manifest of {file_path}: {e}")
+            cover = None
+
+        return cover or self._read_fallback_cover(file_path)
+
+    def _read_fallback_cover(self, file_path: Path) -> tuple[bytes, str] | None:
+        # Fall back to loading the whole book for archives with a missing or inconsistent manifest.
+        # ebooklib holds every archive member in memory, so the book is dropped once its cover is found.
         try:
             book = epub.read_epub(str(file_path))
+        except Exception as e:
+            logger.error(f"Error extracting EPUB cover for {file_path}: {e}")
+            return None
+
+        return self._extract_book_cover(file_path, book)
+
+    def _extract_book_cover(self, file_path: Path, book: epub.EpubBook) -> tuple[bytes, str] | None:
+        try:
             cover_item = None
 
-            for item in book.get_items():
-                if item.get_type() == ebooklib.ITEM_IMAGE and "cover-image" in (item.properties or []):
+            for item in book.get_items_of_type(ebooklib.ITEM_IMAGE):
+                if "cover-image" in (item.properties or ()):
                     cover_item = item
                     break
 
@@ -1,11 +1,42 @@
 from pathlib import Path
+import re
 from typing import Any
 
 import fitz
 
 from core.logger import logger
 
-from .base_parser import BookParser
+from .base_parser import Author, BookParser
+
+# Covers are rendered from the first page. JPEG encodes a full-page bitmap several times
+# faster than PNG's zlib pass and is far smaller; the page has no alpha channel to preserve.
+COVER_DPI = 120
+COVER_JPEG_QUALITY = 85
+
+# A first page made of one image covering at least this share of it is treated as the cover.
+FULL_PAGE_IMAGE_COVERAGE = 0.9
+
+# PDF dates look like "D:YYYYMMDDHHmmSSOHH'mm'"; only the calendar date is kept.
+PDF_DATE_PATTERN = re.compile(r"^D:(\d{4})(\d{2})(\d{2})")
+
+# The only unambiguous separator between several authors in a PDF `/Author` value.
+AUTHOR_SEPARATOR_PATTERN = re.compile(r"\s*;\s*")
+
+
+def split_authors(value: str) -> list[str]:
+    """
+    Split a PDF `/Author` value into names on semicolons only.
+    Commas, "and" and "&" are ambiguous ("Le Guin, Ursula K.", "Simon & Schuster"), so they never split a name.
+    """
+    return [name for name in AUTHOR_SEPARATOR_PATTERN.split(value.strip()) if name]
+
+
+# Embedded image formats that are returned as-is; anything else is rasterized instead.
+EMBEDDED_COVER_MIMETYPES = {
+    "jpeg": "image/jpeg",
+    "jpg": "image/jpeg",
+    "png": "image/png",
+}
 
 
 class PdfParser(BookParser):
@@ -13,30 +44,27 @@ class PdfParser(BookParser):
         metadata = {}
 
         try:
-            doc = fitz.open(str(file_path))
-            meta = doc.metadata
-
-            if meta:
-                metadata["title"] = meta.get("title")
+            with fitz.open(str(file_path)) as doc:
+                meta = doc.metadata
 
-                metadata["authors"] = [
-                    {"name": author} for author in meta.get("author", "").split(";") if author.strip()
-                ]
+                if meta:
+                    title, author, producer, pub_date, keywords = (
+                        meta.get(key) or "" for key in ("title", "author", "producer", "creationDate", "keywords")
+                    )
 
-                metadata["publisher"] = meta.get("producer")
-                pub_date = meta.get("creationDate")
+                    metadata["title"] = title
+                    metadata["authors"] = [Author(name) for name in split_authors(author)]
+                    metadata["publisher"] = producer
 
-                if pub_date and pub_date.startswith("D:"):
-                    from contextlib import suppress
+                    date_match = PDF_DATE_PATTERN.match(pub_date)
 
-                    with suppress(Exception):
-                        metadata["publication_date"] = f"{pub_date[2:6]}-{pub_date[6:8]}-{pub_date[8:10]}"
+                    if date_match:
+                        metadata["publication_date"] = f"{date_match[1]}-{date_match[2]}-{date_match[3]}"
 
-                metadata["tags"] = [tag.strip() for tag in meta.get("keywords", "").split(",") if tag.strip()]
+                    metadata["tags"] = [tag.strip() for tag in keywords.split(",") if tag.strip()]
 
-            metadata["format"] = "PDF"
-            metadata["page_count"] = doc.page_count
-            doc.close()
+                metadata["format"] = "PDF"
+                metadata["page_count"] = doc.page_count
         except Exception as error:
             logger.error(f"Error parsing PDF metadata for {file_path}: {error}")
             metadata["parsing_error"] = str(error)
@@ -45,18 +73,52 @@ class PdfParser(BookParser):
 
     def extract_cover_image_data(self, file_path: Path) -> tuple[bytes, str] | None:
         try:
-            document = fitz.open(str(file_path))
+            with fitz.open(str(file_path)) as document:
+                if document.page_count == 0:
+                    return None
 
-            if document.page_count > 0:
                 page = document.load_page(0)
-                pixels = page.get_pixmap(dpi=150, alpha=False)  # type: ignore
-                img_bytes = pixels.tobytes("png")
-                document.close()
+                embedded_cover = self._extract_full_page_image(document, page)
 
-                return img_bytes, "image/png"
+                if embedded_cover:
+                    return embedded_cover
 
-            document.close()
+                pixels = page.get_pixmap(dpi=COVER_DPI, alpha=False)  # type: ignore
+                return pixels.tobytes("jpeg", jpg_quality=COVER_JPEG_QUALITY), "image/jpeg"
         except Exception as error:
             logger.error(f"Error extracting PDF cover for {file_path}: {error}")
 
         return None
+
+    def _extract_full_page_image(
+        self,
+        document: fitz.Document,
+        page: fitz.Page,
+    ) -> tuple[bytes, str] | None:
+        """
+        Return the stored bytes of an image that fills the page, skipping rasterization.
+        Most ebook PDFs open with a full-bleed scan of the cover.
+        """
+        images = page.get_images(full=True)
+
+        if len(images) != 1:
+            return None
+
+        xref, soft_mask = images[0][0], images[0][1]
+
+        if soft_mask:
+            return None
+
+        rects = page.get_image_rects(xref)
+        page_area = page.rect.get_area()
+
+        if not rects or page_area <= 0 or rects[0].get_area() / page_area < FULL_PAGE_IMAGE_COVERAGE:
+            return None
+
+        image = document.extract_image(xref)
+        mimetype = EMBEDDED_COVER_MIMETYPES.get(image.get("ext", "")) if image else None
+
+        if not mimetype or not image.get("image"):
+            return None
+
+        return image["image"], mimetype
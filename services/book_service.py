@@ -1,42 +1,82 @@
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
 import hashlib
-import io
+import multiprocessing
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from fastapi import Depends, HTTPException
-from PIL import Image
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.v1.schemas.book_schemas import BookInDB, BookUpdate
+from core.config import settings
 from core.crockford import generate_crockford_id
 from core.logger import logger
+from core.pagination import decode_cursor, encode_cursor, InvalidCursorError
 from database import async_session, book_crud, get_database
 from database.storage_crud import get_default_storage
 from models.book import Book
 from models.user import User
-from parsers.base_parser import BookParser
-from parsers.epub_parser import EpubParser
-from parsers.pdf_parser import PdfParser
-from services.storage import create_storage_backend
+from parsers.base_parser import as_records, BookParser, get_parser
+from parsers.batch import parse_batch
+from services.storage import get_cached_storage_backend
 from services.storage.exceptions import StorageBackendError
 from services.storage.storage_backend import StorageBackend, StorageFileType
 
-PARSER_MAPPING = {
-    "EPUB": EpubParser,
-    "PDF": PdfParser,
-}
+# Hashes files already on disk: bulk imports, and uploads queued without a hash from staging.
+# hashlib releases the GIL while digesting, so files hash in parallel on separate cores
+# instead of queueing behind one another on the event loop thread.
+HASH_EXECUTOR = ThreadPoolExecutor(max_workers=settings.HASH_WORKERS, thread_name_prefix="file-hash")
+
+# Cover encoding runs on worker processes when configured, otherwise on the default thread pool
+# (Pillow and libjpeg-turbo release the GIL for most of the work). Forkserver workers are not
+# forked from the running server, so they inherit none of its threads or connections.
+COVER_EXECUTOR = (
+    ProcessPoolExecutor(
+        max_workers=settings.COVER_ENCODE_WORKERS,
+        mp_context=multiprocessing.get_context("forkserver"),
+    )
+    if settings.COVER_ENCODE_WORKERS > 0
+    else None
+)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 class BookService:
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    def _generate_file_hash(self, file_path: Path, hash_algo="md5") -> str:
+    def _generate_file_hash(self, file_path: Path, hash_algo: str = settings.FILE_HASH_ALGORITHM) -> str:
+        # Uploads are hashed by `stage_upload` from a spooled file that is still in the page cache;
+        # this reads files that usually are not, such as a library being imported.
+        # `file_digest` reads into a reusable buffer and hashes in C, without a Python-level chunk loop.
+        with file_path.open("rb") as file:
+            if hasattr(os, "posix_fadvise"):
+                # Ask the kernel for aggressive read-ahead, since the file is read once, front to back.
+                os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            return hashlib.file_digest(file, hash_algo).hexdigest()
+
+    @staticmethod
+    def stage_upload(source: BinaryIO, destination: Path, hash_algo: str = settings.FILE_HASH_ALGORITHM) -> str:
+        """Copy an upload to `destination`, returning its hash computed from the same reads."""
         hasher = hashlib.new(hash_algo)
 
-        with file_path.open("rb") as file:
-            for chunk in iter(lambda: file.read(4096), b""):
-                hasher.update(chunk)
+        # One reused 1 MiB buffer: no allocation per chunk, and few enough iterations that
+        # hashing and writing, not the Python loop, set the pace.
+        chunk = bytearray(UPLOAD_CHUNK_SIZE)
+        view = memoryview(chunk)
+
+        with destination.open("wb") as buffer:
+            while size := source.readinto(chunk):
+                hasher.update(view[:size])
+                buffer.write(view[:size])
 
         return hasher.hexdigest()
 
@@ -47,34 +87,20 @@ class BookService:
             logger.error(f"Could not determine file format for {file_path}.")
             return None
 
-        parser = PARSER_MAPPING.get(file_format)
-
-        if parser:
-            return parser()
-
-        return None
+        return get_parser(file_format)
 
     async def _process_cover(
         self,
+        storage_backend: StorageBackend,
         user: User,
         book_hash: str,
-        book_temp_path: Path,
         cover: bytes,
     ) -> list[dict[str, Any]]:
-        covers = []
-        storage_backend = await self.get_storage_backend(user)
-
-        try:
-            image = Image.open(io.BytesIO(cover))
-        except Exception:
-            logger.exception(f"Error opening cover image for {book_hash}.")
-            return covers
-
         variants = [
             {
                 "name": "original",
                 "size": None,
-                "quality": 100,
+                "quality": settings.COVER_JPEG_QUALITY,
             },
             {
                 "name": "thumbnail",
@@ -83,48 +109,57 @@ class BookService:
             },
         ]
 
-        for variant in variants:
-            try:
-                variant_image = image.copy()
-
-                if variant["size"]:
-                    variant_image.thumbnail(variant["size"])
+        # Variants are rendered and uploaded concurrently; a failed variant is simply left out.
+        results = await asyncio.gather(
+            *(self._store_cover_variant(storage_backend, user, book_hash, cover, variant) for variant in variants),
+        )
 
-                cover_filename = f"{variant['name']}.jpg"
+        return [result for result in results if result is not None]
 
-                variant_image.convert("RGB").save(
-                    book_temp_path.parent / cover_filename,
-                    "JPEG",
-                    quality=variant["quality"],
-                )
+    async def _store_cover_variant(
+        self,
+        storage_backend: StorageBackend,
+        user: User,
+        book_hash: str,
+        cover: bytes,
+        variant: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        # Imported on first use, since the imaging stack (Pillow, numpy) is only needed for uploads with covers.
+        from services.covers import encode_cover_variant, log_imaging_build
 
-                cover_path_real = storage_backend.store_file(
-                    user,
-                    book_temp_path.parent / cover_filename,
-                    book_hash,
-                    cover_filename,
-                    StorageFileType.COVER,
-                )
+        log_imaging_build()
 
-                covers.append(
-                    {
-                        "filename": cover_filename,
-                        "path": str(cover_path_real),
-                        "variant": variant["name"],
-                    },
-                )
-            except Exception:
-                logger.exception(
-                    f"Error processing cover variant '{variant['name']}' for {book_hash}.",
-                )
+        cover_filename = f"{variant['name']}.jpg"
 
-        for cover_file in covers:
-            cover_path_temp = book_temp_path.parent / cover_file["filename"]
+        try:
+            # Encoded in memory and handed to the backend directly, with no temporary file.
+            data = await asyncio.get_running_loop().run_in_executor(
+                COVER_EXECUTOR,
+                encode_cover_variant,
+                cover,
+                variant["size"],
+                variant["quality"],
+            )
 
-            if cover_path_temp.exists():
-                cover_path_temp.unlink()
+            cover_path_real = await asyncio.to_thread(
+                storage_backend.store_bytes,
+                user,
+                data,
+                book_hash,
+                cover_filename,
+                StorageFileType.COVER,
+            )
+        except Exception:
+            logger.exception(
+                f"Error processing cover variant '{variant['name']}' for {book_hash}.",
+            )
+            return None
 
-        return covers
+        return {
+            "filename": cover_filename,
+            "path": str(cover_path_real),
+            "variant": variant["name"],
+        }
 
     @staticmethod
     async def store_book(
@@ -132,7 +167,12 @@ class BookService:
         original_filename: str,
         user_id: str | None = None,
         book_id: str | None = None,
+        file_hash: str | None = None,
     ) -> BookInDB | None:
+        """
+        Process a staged upload into a stored book.
+        Pass `file_hash` when it was already computed while staging to skip re-reading the file.
+        """
         from database import async_session
         from models.user import User
 
@@ -150,6 +190,7 @@ class BookService:
                 original_filename,
                 book_id,
                 user,
+                file_hash,
             )
 
     @staticmethod
@@ -173,7 +214,8 @@ class BookService:
 
             db.add(book)
             await db.commit()
-            await db.refresh(book)
+
+            # Every field the upload response needs was set here, so the row is not reloaded.
             return book
 
     async def _store_book_impl(
@@ -182,30 +224,15 @@ class BookService:
         original_filename: str,
         book_id,
         user: User | None = None,
+        file_hash: str | None = None,
     ) -> BookInDB | None:
         await self.update_book_status(book_id, "processing")
+        parsing: asyncio.Future | None = None
 
         try:
-            file_hash = self._generate_file_hash(source_file_path)
-            existing_book = await book_crud.get_book_by_hash(self.db, file_hash)
-
-            if existing_book:
-                if source_file_path.exists():
-                    source_file_path.unlink()
-
-                await self.update_book_status(book_id, "failed", error="Duplicate book")
-
-                logger.warning(
-                    f"Book with same content (hash: {file_hash}) already exists with ID: {getattr(existing_book, 'id', None)}.",
-                )
-                return None
-
             parser = await self._get_parser(source_file_path)
 
             if not parser:
-                if source_file_path.exists():
-                    source_file_path.unlink()
-
                 await self.update_book_status(
                     book_id,
                     "failed",
@@ -215,34 +242,32 @@ class BookService:
                 logger.warning(f"Unsupported file format for {original_filename}.")
                 return None
 
-            metadata = parser.parse_metadata(source_file_path)
+            parsed = None
+
+            if file_hash is None:
+                # Hashing and parsing both read the whole file, so they run side by side off the event loop.
+                file_hash, parsed = await asyncio.gather(
+                    asyncio.get_running_loop().run_in_executor(
+                        HASH_EXECUTOR,
+                        self._generate_file_hash,
+                        source_file_path,
+                    ),
+                    asyncio.to_thread(parser.parse, source_file_path),
+                )
+
+            existing_book = await book_crud.get_book_by_hash(self.db, file_hash)
+
+            if existing_book:
+                await self.update_book_status(book_id, "failed", error="Duplicate book")
 
-            if "parsing_error" in metadata:
                 logger.warning(
-                    f"Metadata parsing issue for {original_filename}: {metadata['parsing_error']}",
+                    f"Book with same content (hash: {file_hash}) already exists with ID: {getattr(existing_book, 'id', None)}.",
                 )
+                return None
 
-            book_data: dict[str, Any] = {
-                "title": metadata.get("title") or original_filename,
-                "authors": metadata.get("authors", []),
-                "publisher": metadata.get("publisher"),
-                "publication_date": metadata.get("publication_date"),
-                "language": metadata.get("language"),
-                "description": metadata.get("description"),
-                "tags": metadata.get("tags", []),
-                "identifiers": metadata.get("identifiers", []),
-                "format": metadata.get(
-                    "format",
-                    parser.get_file_format(source_file_path),
-                ),
-                "file_hash": file_hash,
-                "file_size_bytes": source_file_path.stat().st_size,
-                "original_filename": original_filename,
-                "status": "processing",
-                "covers": [],
-            }
-
-            book_data = {k: v for k, v in book_data.items() if v is not None}
+            if parsed is None:
+                # Parsing starts on a worker thread first, so a storage lookup that has to query the database overlaps it.
+                parsing = asyncio.ensure_future(asyncio.to_thread(parser.parse, source_file_path))
 
             try:
                 storage_backend = await self.get_storage_backend(user)
@@ -272,9 +297,43 @@ class BookService:
                     detail="Unexpected error while getting storage backend.",
                 ) from error
 
+            if parsing is not None:
+                parsed = await parsing
+
+            metadata, cover_data_tuple = parsed
+
+            if "parsing_error" in metadata:
+                logger.warning(
+                    f"Metadata parsing issue for {original_filename}: {metadata['parsing_error']}",
+                )
+
+            book_data: dict[str, Any] = {
+                "title": metadata.get("title") or original_filename,
+                "authors": as_records(metadata.get("authors", ())),
+                "publisher": metadata.get("publisher"),
+                "publication_date": metadata.get("publication_date"),
+                "language": metadata.get("language"),
+                "description": metadata.get("description"),
+                "tags": metadata.get("tags", []),
+                "identifiers": as_records(metadata.get("identifiers", ())),
+                "format": metadata.get(
+                    "format",
+                    parser.get_file_format(source_file_path),
+                ),
+                "file_hash": file_hash,
+                "file_size_bytes": source_file_path.stat().st_size,
+                "original_filename": original_filename,
+                "status": "processing",
+                "covers": [],
+            }
+
+            book_data = {k: v for k, v in book_data.items() if v is not None}
+
             stored_filename = f"{source_file_path.stem}{source_file_path.suffix}"
 
-            stored_file_path = storage_backend.store_file(
+            # The book file and its cover variants are uploaded concurrently.
+            store_book_file = asyncio.to_thread(
+                storage_backend.store_file,
                 user,
                 source_file_path,
                 file_hash,
@@ -282,39 +341,141 @@ class BookService:
                 StorageFileType.BOOK,
             )
 
-            book_data["stored_filename"] = stored_filename
-            book_data["file_path"] = str(stored_file_path)
-            cover_data_tuple = parser.extract_cover_image_data(source_file_path)
-
             if cover_data_tuple:
-                book_data["covers"] = await self._process_cover(
-                    user,
-                    file_hash,
-                    source_file_path,
-                    cover_data_tuple[0],
+                stored_file_path, book_data["covers"] = await asyncio.gather(
+                    store_book_file,
+                    self._process_cover(
+                        storage_backend,
+                        user,
+                        file_hash,
+                        cover_data_tuple[0],
+                    ),
                 )
+            else:
+                stored_file_path = await store_book_file
 
-            await book_crud.update_book_metadata(
+            book_data["stored_filename"] = stored_filename
+            book_data["file_path"] = str(stored_file_path)
+            # The metadata write also completes the book, instead of a separate status update and reload.
+            book_data["status"] = "completed"
+
+            book = await book_crud.update_book_metadata(
                 self.db,
                 book_id,
                 BookUpdate(**book_data),
             )
 
-            await self.update_book_status(book_id, "completed")
-
-            if source_file_path.exists():
-                source_file_path.unlink()
-
-            book = await book_crud.get_book_by_id(self.db, book_id)
-            return BookInDB.model_validate(book.__dict__)
+            return BookInDB.model_validate(book)
         except Exception as e:
+            # A failed write (e.g. a concurrent upload of the same file) leaves the transaction aborted,
+            # so the failure is recorded in a fresh one rather than leaving the book "processing".
+            await self.db.rollback()
             await self.update_book_status(book_id, "failed", error=str(e))
             logger.exception(f"Book processing failed for {original_filename}: {e}")
 
-            if source_file_path.exists():
-                source_file_path.unlink()
-
             return None
+        finally:
+            if parsing is not None:
+                # A parse abandoned by a failed storage lookup is discarded instead of reporting an unretrieved error.
+                parsing.cancel()
+
+            # The staged upload is never needed after processing, whatever the outcome.
+            source_file_path.unlink(missing_ok=True)
+
+    async def import_books(self, file_paths: Iterable[Path], user: User) -> list[str]:
+        """
+        Ingest many book files already on the server, such as an initial library import.
+        Files are parsed across worker processes, hashed, stored with their covers and inserted as
+        completed books in one executemany. Unsupported formats and duplicates are skipped, and
+        source files are left in place. Returns the IDs of the created books.
+        """
+        batch = await asyncio.to_thread(parse_batch, file_paths)
+        loop = asyncio.get_running_loop()
+
+        file_hashes = await asyncio.gather(
+            *(loop.run_in_executor(HASH_EXECUTOR, self._generate_file_hash, path) for path in batch.file_paths),
+        )
+
+        # One query for the whole batch; files repeated within the batch are only stored once.
+        seen_hashes = await book_crud.get_existing_file_hashes(self.db, list(set(file_hashes)))
+        indices = []
+
+        for i, file_hash in enumerate(file_hashes):
+            if file_hash in seen_hashes:
+                logger.warning(f"Skipping {batch.file_paths[i]}: a book with hash {file_hash} already exists.")
+                continue
+
+            if batch.parsing_errors[i]:
+                logger.warning(f"Metadata parsing issue for {batch.file_paths[i]}: {batch.parsing_errors[i]}")
+
+            seen_hashes.add(file_hash)
+            indices.append(i)
+
+        storage_backend = await self.get_storage_backend(user)
+
+        results = await asyncio.gather(
+            *(
+                self._store_imported_book(storage_backend, user, batch.file_paths[i], file_hashes[i], batch.covers[i])
+                for i in indices
+            ),
+            return_exceptions=True,
+        )
+
+        stored_indices = []
+        columns: dict[str, list[Any]] = {
+            "file_hash": [],
+            "file_path": [],
+            "stored_filename": [],
+            "file_size_bytes": [],
+            "covers": [],
+        }
+
+        for i, result in zip(indices, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to store imported book {batch.file_paths[i]}: {result}", exc_info=result)
+                continue
+
+            stored_indices.append(i)
+            columns["file_hash"].append(file_hashes[i])
+
+            for name, value in result.items():
+                columns[name].append(value)
+
+        rows = batch.to_rows(stored_indices, columns, user_id=user.id, status="completed")
+        return await book_crud.create_books_bulk(self.db, rows)
+
+    async def _store_imported_book(
+        self,
+        storage_backend: StorageBackend,
+        user: User,
+        file_path: Path,
+        file_hash: str,
+        cover: tuple[bytes, str] | None,
+    ) -> dict[str, Any]:
+        # As with uploads, the book file and its cover variants are stored concurrently.
+        store_book_file = asyncio.to_thread(
+            storage_backend.store_file,
+            user,
+            file_path,
+            file_hash,
+            file_path.name,
+            StorageFileType.BOOK,
+        )
+
+        if cover:
+            stored_file_path, covers = await asyncio.gather(
+                store_book_file,
+                self._process_cover(storage_backend, user, file_hash, cover[0]),
+            )
+        else:
+            stored_file_path, covers = await store_book_file, []
+
+        return {
+            "file_path": str(stored_file_path),
+            "stored_filename": file_path.name,
+            "file_size_bytes": file_path.stat().st_size,
+            "covers": covers,
+        }
 
     async def get_books(
         self,
@@ -325,7 +486,25 @@ class BookService:
         tags: list[str] | None = None,
         sort_by: str = "title",
         sort_order: str = "asc",
-    ) -> tuple[list[dict[str, Any]], int]:
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], int, str | None]:
+        after = None
+
+        if cursor:
+            try:
+                sort_value, last_id = decode_cursor(cursor)
+
+                if sort_by == "uploaded_at" and sort_value is not None:
+                    sort_value = datetime.fromisoformat(sort_value)
+            except (InvalidCursorError, TypeError, ValueError) as error:
+                raise HTTPException(status_code=400, detail="Invalid pagination cursor.") from error
+
+            if sort_by == "title" and not isinstance(sort_value, str):
+                # Any other JSON value would reach the `coalesce(title, '')` comparison as a non-string bind.
+                raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+
+            after = (sort_value, last_id)
+
         books, count = await book_crud.get_all_books(
             self.db,
             user_id,
@@ -335,9 +514,25 @@ class BookService:
             tags,
             sort_by,
             sort_order,
+            after,
         )
 
-        return [BookInDB.model_validate(book.__dict__).model_dump() for book in books], int(count or 0)
+        # Rows come straight from the database, so they are only validated once, when the route builds `BookListItem`.
+        items = [dict(book._mapping) for book in books]
+        next_cursor = None
+
+        if len(items) == limit:
+            sort_value = items[-1].get(sort_by)
+
+            if sort_by == "title":
+                # Titles are ordered as `coalesce(title, '')`, so an untitled book continues from ''.
+                sort_value = sort_value or ""
+
+            # `uploaded_at` is set by the database and never NULL in practice, but a NULL key cannot be sought past.
+            if sort_value is not None:
+                next_cursor = encode_cursor(sort_value, items[-1]["id"])
+
+        return items, int(count or 0), next_cursor
 
     async def get_book_by_id(
         self,
@@ -353,7 +548,7 @@ class BookService:
         if raw:
             return book
 
-        return BookInDB.model_validate(book.__dict__)
+        return BookInDB.model_validate(book)
 
     async def update_book_by_id(
         self,
@@ -374,13 +569,7 @@ class BookService:
         status: str,
         error: str | None = None,
     ):
-        book = await book_crud.get_book_by_id(self.db, book_id)
-
-        if book:
-            book.status = status
-            book.processing_error = error
-            await self.db.commit()
-            await self.db.refresh(book)
+        await book_crud.update_book_status(self.db, book_id, status, error)
 
     async def delete_book_by_id(self, user: User, book_id: str) -> int:
         book = await book_crud.get_book_by_id(self.db, book_id)
@@ -397,21 +586,13 @@ class BookService:
         book_filename = book.stored_filename
 
         if book_filename is not None:
-            if book.stored_filename:
-                storage_backend.delete_file(
-                    user,
-                    book.file_hash,
-                    book.stored_filename,
-                    StorageFileType.BOOK,
-                )
+            files = [(cover["filename"], StorageFileType.COVER) for cover in book.covers]
 
-            for cover in book.covers:
-                storage_backend.delete_file(
-                    user,
-                    book.file_hash,
-                    cover["filename"],
-                    StorageFileType.COVER,
-                )
+            if book_filename:
+                files.append((book_filename, StorageFileType.BOOK))
+
+            # The book and its covers go in one backend call, which MinIO turns into a single request.
+            await asyncio.to_thread(storage_backend.delete_files, user, book.file_hash, files)
 
         return await book_crud.delete_book_metadata(self.db, book_id)
 
@@ -433,7 +614,7 @@ class BookService:
         user_id = user.id
         storage = await get_default_storage(self.db, user_id)
 
-        return create_storage_backend(storage)
+        return get_cached_storage_backend(storage)
 
 
 def get_book_service(
@@ -0,0 +1,101 @@
+"""Cover image encoding, kept free of app state so it can run in worker processes."""
+
+import functools
+import io
+import shutil
+import subprocess
+
+import PIL
+from PIL import features, Image, ImageFile
+
+from core.logger import logger
+
+try:
+    import numpy as np
+    import simplejpeg
+except ImportError:
+    # Optional (`pip install .[imaging]`); Pillow encodes covers when it is missing.
+    simplejpeg = None
+
+# Covers are recognized as JPEG by their SOI marker: declared media types in EPUB manifests are
+# not reliable enough to decide whether bytes can be stored as a `.jpg` without re-encoding.
+JPEG_MAGIC = b"\xff\xd8\xff"
+
+# Only probe the formats books actually embed covers in, rather than every installed plugin.
+COVER_IMAGE_FORMATS = ("JPEG", "PNG", "GIF", "WEBP")
+
+# Encode covers in a single buffer pass instead of Pillow's default 64 KiB blocks.
+ImageFile.MAXBLOCK = 2**25
+
+# jpegtran (libjpeg-turbo-progs) losslessly shrinks JPEG covers when it is installed.
+JPEGTRAN_PATH = shutil.which("jpegtran")
+JPEGTRAN_TIMEOUT = 10
+
+
+@functools.cache
+def log_imaging_build() -> None:
+    """Log the Pillow build once, when the first cover is processed rather than at startup."""
+    # pillow-simd reports a ".postN" version; covers are much slower without libjpeg-turbo.
+    logger.info(
+        f"Pillow {PIL.__version__} (SIMD build: {'.post' in PIL.__version__}, "
+        f"libjpeg-turbo: {features.check_feature('libjpeg_turbo')}, simplejpeg: {simplejpeg is not None}).",
+    )
+
+
+def optimize_jpeg(cover: bytes) -> bytes | None:
+    """Losslessly rewrite a JPEG with jpegtran, returning `None` if it could not be optimized."""
+    try:
+        result = subprocess.run(  # noqa: S603 - fixed argument list, no shell.
+            [JPEGTRAN_PATH, "-optimize", "-progressive"],
+            input=cover,
+            capture_output=True,
+            timeout=JPEGTRAN_TIMEOUT,
+            check=False,
+        )
+    except subprocess.TimeoutExpired:
+        logger.warning("jpegtran timed out optimizing a cover; storing it unchanged.")
+        return None
+
+    if result.returncode != 0:
+        logger.warning(f"jpegtran failed to optimize a cover: {result.stderr.decode(errors='replace').strip()}")
+        return None
+
+    return result.stdout
+
+
+def encode_cover_variant(
+    cover: bytes,
+    size: tuple[int, int] | None,
+    quality: int,
+) -> bytes:
+    """Encode one cover variant as JPEG bytes; `size` bounds the thumbnail, `None` keeps full size."""
+    is_jpeg = cover.startswith(JPEG_MAGIC)
+
+    if size is None and is_jpeg:
+        # Re-encoding a full-size JPEG would only cost time and quality. jpegtran rewrites it
+        # losslessly with optimized Huffman tables; without it the source bytes are kept.
+        optimized = optimize_jpeg(cover) if JPEGTRAN_PATH else None
+        return optimized or cover
+
+    # Each variant opens the source afresh: a full-resolution copy would already be decoded,
+    # which rules out draft mode, where JPEG sources are decoded at a reduced DCT scale.
+    image = Image.open(io.BytesIO(cover), formats=COVER_IMAGE_FORMATS)
+
+    if size:
+        if is_jpeg:
+            # libjpeg decodes straight to the nearest 1/2, 1/4 or 1/8 scale that still covers `size`.
+            image.draft("RGB", size)
+
+        image.thumbnail(size)
+
+    # `convert` copies even when the mode already matches, so only call it when needed.
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+
+    if simplejpeg is not None:
+        # Same 4:2:0 chroma subsampling as Pillow's default, encoded by libjpeg-turbo directly.
+        return simplejpeg.encode_jpeg(np.asarray(image), quality=quality, colorspace="RGB", colorsubsampling="420")
+
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=quality, optimize=True, progressive=True)
+    return buffer.getvalue()
@@ -1,22 +1,28 @@
 """Utilities for resolving storage backends."""
 
-from models.storage import Storage
+import json
+
+from core.cache import MISSING, TTLCache
+from database.storage_crud import StorageSnapshot
 from services.storage.exceptions import StorageBackendError
 from services.storage.filesystem_storage import FileSystemStorage
-from services.storage.minio_storage import MinIOStorage
 from services.storage.storage_backend import StorageBackend
 
-STORAGE_BACKENDS: dict[str, type[StorageBackend]] = {
-    "FILE_SYSTEM": FileSystemStorage,
-    "MINIO": MinIOStorage,
-}
+STORAGE_TYPES = frozenset({"FILE_SYSTEM", "MINIO"})
+
+# The file system backend holds no state, so every local storage shares one instance.
+LOCAL_STORAGE_BACKEND = FileSystemStorage()
 
+# Backends wrap long-lived clients (MinIO keeps an HTTP connection pool), so one instance is
+# reused per storage configuration instead of being rebuilt for every upload, download or delete.
+storage_backend_cache = TTLCache(ttl=300)
 
-def create_storage_backend(storage: Storage | None) -> StorageBackend:
-    """Create a :class:`StorageBackend` from a storage model instance.
+
+def create_storage_backend(storage: StorageSnapshot | None) -> StorageBackend:
+    """Create a :class:`StorageBackend` from a storage configuration.
 
     Args:
-        storage: The storage configuration from the database. ``None``
+        storage: The storage configuration read from the database. ``None``
             results in the default local file system storage.
 
     Raises:
@@ -24,15 +30,18 @@ def create_storage_backend(storage: Storage | None) -> StorageBackend:
     """
 
     if storage is None:
-        return FileSystemStorage()
+        return LOCAL_STORAGE_BACKEND
 
-    backend_cls = STORAGE_BACKENDS.get(storage.storage_type.upper())
+    storage_type = storage.storage_type.upper()
 
-    if backend_cls is None:
+    if storage_type not in STORAGE_TYPES:
         raise StorageBackendError(StorageBackendError.NOT_FOUND)
 
-    if backend_cls is FileSystemStorage:
-        return backend_cls()
+    if storage_type == "FILE_SYSTEM":
+        return LOCAL_STORAGE_BACKEND
+
+    # The MinIO SDK and its HTTP stack are only imported once a MinIO storage is actually used.
+    from services.storage.minio_storage import MinIOStorage
 
     # MINIO or other backends requiring config
     config = storage.config or {}
@@ -47,3 +56,26 @@ def create_storage_backend(storage: Storage | None) -> StorageBackend:
         )
     except KeyError as exc:  # pragma: no cover - configuration errors
         raise StorageBackendError(StorageBackendError.NOT_CONFIGURED) from exc
+
+
+def get_cached_storage_backend(storage: StorageSnapshot | None) -> StorageBackend:
+    """Return a shared :class:`StorageBackend` for the storage configuration.
+
+    The cache key includes the type and configuration, so an edited storage gets a new backend.
+
+    Raises:
+        StorageBackendError: If the storage type is unknown or misconfigured.
+    """
+
+    key = None
+
+    if storage is not None:
+        key = (storage.id, storage.storage_type, json.dumps(storage.config, sort_keys=True, default=str))
+
+    backend = storage_backend_cache.get(key)
+
+    if backend is MISSING:
+        backend = create_storage_backend(storage)
+        storage_backend_cache.set(key, backend)
+
+    return backend
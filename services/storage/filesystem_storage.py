@@ -1,9 +1,71 @@
+from collections.abc import Iterator
+import functools
+import os
 from pathlib import Path
 import shutil
 
 from core.config import settings
 from models.user import User
-from services.storage.storage_backend import StorageBackend, StorageFileType
+from services.storage.storage_backend import BOOK_DIR_FILE_TYPES, StorageBackend, StorageFileType, STREAM_CHUNK_SIZE
+
+
+def _copy_in_kernel(source: Path, target: Path) -> None:
+    """
+    Copy with `copy_file_range`, which never moves bytes through user space and
+    reflinks on copy-on-write filesystems. Falls back to `shutil.copyfile` (sendfile).
+    """
+    if hasattr(os, "copy_file_range"):
+        with source.open("rb") as source_file, target.open("wb") as target_file:
+            remaining = os.fstat(source_file.fileno()).st_size
+
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(source_file.fileno(), target_file.fileno(), remaining)
+
+                    if copied == 0:
+                        break
+
+                    remaining -= copied
+            except OSError:
+                pass
+            else:
+                return
+
+    shutil.copyfile(source, target)
+
+
+@functools.lru_cache(maxsize=4096)
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory once per process; see `invalidate_prepared_dirs` for directories removed behind our back."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def invalidate_prepared_dirs() -> None:
+    """Forget which directories were created, e.g. after manual cleanup or a volume remount."""
+    _ensure_dir.cache_clear()
+
+
+def _recreate_dir(path: Path) -> None:
+    invalidate_prepared_dirs()
+    _ensure_dir(path)
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    target.unlink(missing_ok=True)
+
+    try:
+        # Staged uploads usually live on the same filesystem, where a hard link stores them without copying.
+        target.hardlink_to(source)
+    except OSError:
+        # Different filesystems or no hard link support.
+        _copy_in_kernel(source, target)
+
+
+def _read_chunks(file_path: Path) -> Iterator[bytes]:
+    with file_path.open("rb") as file:
+        while chunk := file.read(STREAM_CHUNK_SIZE):
+            yield chunk
 
 
 class FileSystemStorage(StorageBackend):
@@ -12,9 +74,7 @@ class FileSystemStorage(StorageBackend):
         return True
 
     def get_prepared_book_dir(self, user: User, book_dir: str) -> Path:
-        book_path = settings.BOOK_FILES_DIR / str(user.id) / book_dir
-        book_path.mkdir(parents=True, exist_ok=True)
-        return book_path
+        return _ensure_dir(settings.BOOK_FILES_DIR / str(user.id) / book_dir)
 
     def get_file(
         self,
@@ -23,10 +83,9 @@ class FileSystemStorage(StorageBackend):
         filename: str,
         filetype: StorageFileType,
     ) -> Path | None:
-        book_path = self.get_prepared_book_dir(user, book_dir)
-
-        if filetype == StorageFileType.BOOK or filetype == StorageFileType.COVER:
-            file_path = book_path / filename
+        # Lookups do not go through `get_prepared_book_dir`, so reading never creates directories.
+        if filetype in BOOK_DIR_FILE_TYPES:
+            file_path = settings.BOOK_FILES_DIR / str(user.id) / book_dir / filename
         else:
             return None
 
@@ -35,6 +94,20 @@ class FileSystemStorage(StorageBackend):
 
         return None
 
+    def open_stream(
+        self,
+        user: User,
+        book_dir: str,
+        filename: str,
+        filetype: StorageFileType,
+    ) -> Iterator[bytes] | None:
+        file_path = self.get_file(user, book_dir, filename, filetype)
+
+        if file_path is None:
+            return None
+
+        return _read_chunks(file_path)
+
     def store_file(
         self,
         user: User,
@@ -45,12 +118,41 @@ class FileSystemStorage(StorageBackend):
     ) -> Path:
         book_path = self.get_prepared_book_dir(user, book_dir)
 
-        if filetype == StorageFileType.BOOK or filetype == StorageFileType.COVER:
+        if filetype in BOOK_DIR_FILE_TYPES:
+            target_path = book_path / filename
+        else:
+            raise ValueError()
+
+        try:
+            _link_or_copy(source, target_path)
+        except FileNotFoundError:
+            # The cached book directory was removed while the app ran; create it again and retry once.
+            _recreate_dir(book_path)
+            _link_or_copy(source, target_path)
+
+        return target_path
+
+    def store_bytes(
+        self,
+        user: User,
+        data: bytes,
+        book_dir: str,
+        filename: str,
+        filetype: StorageFileType,
+    ) -> Path:
+        book_path = self.get_prepared_book_dir(user, book_dir)
+
+        if filetype in BOOK_DIR_FILE_TYPES:
             target_path = book_path / filename
         else:
             raise ValueError()
 
-        shutil.copyfile(str(source), str(target_path))
+        try:
+            target_path.write_bytes(data)
+        except FileNotFoundError:
+            _recreate_dir(book_path)
+            target_path.write_bytes(data)
+
         return target_path
 
     def delete_file(
@@ -62,13 +164,15 @@ class FileSystemStorage(StorageBackend):
     ) -> bool:
         book_path = self.get_prepared_book_dir(user, book_dir)
 
-        if filetype == StorageFileType.BOOK or filetype == StorageFileType.COVER:
+        if filetype in BOOK_DIR_FILE_TYPES:
             file_path = book_path / filename
         else:
             return False
 
-        if file_path.exists():
+        # A single unlink; a missing file surfaces as ENOENT instead of costing a separate stat.
+        try:
             file_path.unlink()
-            return True
+        except FileNotFoundError:
+            return False
 
-        return False
+        return True
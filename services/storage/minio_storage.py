@@ -1,14 +1,76 @@
+from collections.abc import Iterator
+import io
 import logging
+import os
 from pathlib import Path
+import threading
 
+import certifi
 from minio import Minio
+from minio.deleteobjects import DeleteObject
+from minio.error import S3Error
+import urllib3
 
 from core.config import settings
 from models.user import User
-from services.storage.storage_backend import StorageBackend, StorageFileType
+from services.storage.storage_backend import BOOK_DIR_FILE_TYPES, StorageBackend, StorageFileType, STREAM_CHUNK_SIZE
 
 logger = logging.getLogger(__name__)
 
+# Expected when a file was never stored; reported without a traceback.
+MISSING_OBJECT_CODES = frozenset({"NoSuchKey", "NoSuchBucket"})
+
+# Parallel part uploads and concurrent cover writes share one client; the SDK's pool of 10 would drop
+# surplus keep-alive connections and reconnect for every part.
+HTTP_POOL_SIZE = max(10, 2 * settings.MINIO_UPLOAD_PARALLEL_PARTS)
+HTTP_TIMEOUT = 300
+
+# Clients are shared by every backend pointing at the same server and credentials, so their connection
+# pools (and the TLS sessions in them) outlive backend cache expiry and storages that differ only by bucket.
+_client_pool: dict[tuple[str, str, str, bool], Minio] = {}
+_client_pool_lock = threading.Lock()
+
+
+def _log_s3_retrieval_error(object_name: str, error: S3Error) -> None:
+    """Log a failed object read; missing objects are expected and logged without a traceback."""
+    if error.code in MISSING_OBJECT_CODES:
+        logger.debug("File %s does not exist.", object_name)
+    else:
+        logger.error("Error retrieving file %s.", object_name, exc_info=error)
+
+
+def get_client(endpoint: str, access_key: str, secret_key: str, secure: bool) -> Minio:
+    key = (endpoint, access_key, secret_key, secure)
+
+    with _client_pool_lock:
+        client = _client_pool.get(key)
+
+        if client is None:
+            client = Minio(
+                endpoint=endpoint,
+                access_key=access_key,
+                secret_key=secret_key,
+                secure=secure,
+                http_client=urllib3.PoolManager(
+                    maxsize=HTTP_POOL_SIZE,
+                    timeout=urllib3.Timeout(connect=HTTP_TIMEOUT, read=HTTP_TIMEOUT),
+                    cert_reqs="CERT_REQUIRED",
+                    ca_certs=os.getenv("SSL_CERT_FILE") or certifi.where(),
+                    retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+                ),
+            )
+            _client_pool[key] = client
+
+    return client
+
+
+def _stream_response(response: urllib3.BaseHTTPResponse) -> Iterator[bytes]:
+    try:
+        yield from response.stream(STREAM_CHUNK_SIZE)
+    finally:
+        response.close()
+        response.release_conn()
+
 
 class MinIOStorage(StorageBackend):
     def __init__(
@@ -18,15 +80,14 @@ class MinIOStorage(StorageBackend):
         access_key: str,
         secret_key: str,
         secure: bool = False,
+        part_size: int = settings.MINIO_UPLOAD_PART_SIZE,
+        parallel_uploads: int = settings.MINIO_UPLOAD_PARALLEL_PARTS,
     ):
         self.bucket_name = bucket_name
+        self.part_size = part_size
+        self.parallel_uploads = parallel_uploads
 
-        self.client = Minio(
-            endpoint=endpoint,
-            access_key=access_key,
-            secret_key=secret_key,
-            secure=secure,
-        )
+        self.client = get_client(endpoint, access_key, secret_key, secure)
 
     @property
     def is_local(self) -> bool:
@@ -47,13 +108,37 @@ class MinIOStorage(StorageBackend):
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            self.client.fget_object(self.bucket_name, object_name, str(local_path))
+            self.client.fget_object(self.bucket_name, object_name, os.fspath(local_path))
+        except S3Error as error:
+            _log_s3_retrieval_error(object_name, error)
+            return None
         except Exception:
             logger.exception("Error retrieving file %s.", object_name)
             return None
         else:
             return local_path
 
+    def open_stream(
+        self,
+        user: User,
+        book_dir: str,
+        filename: str,
+        filetype: StorageFileType,
+    ) -> Iterator[bytes] | None:
+        object_name = self._get_object_name(user, book_dir, filename, filetype)
+
+        # The request is sent here, so a missing object is reported before any response starts.
+        try:
+            response = self.client.get_object(self.bucket_name, object_name)
+        except S3Error as error:
+            _log_s3_retrieval_error(object_name, error)
+            return None
+        except Exception:
+            logger.exception("Error retrieving file %s.", object_name)
+            return None
+
+        return _stream_response(response)
+
     def store_file(
         self,
         user: User,
@@ -67,7 +152,29 @@ class MinIOStorage(StorageBackend):
         if not self.client.bucket_exists(self.bucket_name):
             self.client.make_bucket(self.bucket_name)
 
-        self.client.fput_object(self.bucket_name, object_name, str(source))
+        self.client.fput_object(
+            self.bucket_name,
+            object_name,
+            os.fspath(source),
+            part_size=self.part_size,
+            num_parallel_uploads=self.parallel_uploads,
+        )
+        return Path(object_name)
+
+    def store_bytes(
+        self,
+        user: User,
+        data: bytes,
+        book_dir: str,
+        filename: str,
+        filetype: StorageFileType,
+    ) -> Path:
+        object_name = self._get_object_name(user, book_dir, filename, filetype)
+
+        if not self.client.bucket_exists(self.bucket_name):
+            self.client.make_bucket(self.bucket_name)
+
+        self.client.put_object(self.bucket_name, object_name, io.BytesIO(data), len(data))
         return Path(object_name)
 
     def delete_file(
@@ -87,6 +194,29 @@ class MinIOStorage(StorageBackend):
         else:
             return True
 
+    def delete_files(
+        self,
+        user: User,
+        book_dir: str,
+        files: list[tuple[str, StorageFileType]],
+    ) -> int:
+        # One multi-object delete request instead of a DELETE per file.
+        objects = [
+            DeleteObject(self._get_object_name(user, book_dir, filename, filetype)) for filename, filetype in files
+        ]
+
+        try:
+            # Deletion is lazy; the request is only sent once the error iterator is consumed.
+            errors = list(self.client.remove_objects(self.bucket_name, objects))
+        except Exception:
+            logger.exception("Error deleting files in %s.", book_dir)
+            return 0
+
+        for error in errors:
+            logger.error("Error deleting file %s: %s.", error.name, error.message)
+
+        return len(objects) - len(errors)
+
     def _get_object_name(
         self,
         user: User,
@@ -96,7 +226,7 @@ class MinIOStorage(StorageBackend):
     ) -> str:
         prefix = f"books/{user.id}/{book_dir}"
 
-        if filetype == StorageFileType.BOOK or filetype == StorageFileType.COVER:
+        if filetype in BOOK_DIR_FILE_TYPES:
             return f"{prefix}/{filename}"
 
         raise ValueError()
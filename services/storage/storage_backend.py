@@ -1,15 +1,22 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from enum import Enum
 from pathlib import Path
 
 from models.user import User
 
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 class StorageFileType(Enum):
     BOOK = "book"
     COVER = "cover"
 
 
+# File types kept in a book's directory; membership is a single hash lookup on every storage call.
+BOOK_DIR_FILE_TYPES = frozenset({StorageFileType.BOOK, StorageFileType.COVER})
+
+
 class StorageBackend(ABC):
     @property
     @abstractmethod
@@ -28,6 +35,17 @@ class StorageBackend(ABC):
         """Retrieve a file by its storage identifier (book directory and optional subfilename)."""
         pass
 
+    @abstractmethod
+    def open_stream(
+        self,
+        user: User,
+        book_dir: str,
+        filename: str,
+        filetype: StorageFileType,
+    ) -> Iterator[bytes] | None:
+        """Open a stored file as an iterator of chunks, or return `None` when it cannot be opened."""
+        pass
+
     @abstractmethod
     def store_file(
         self,
@@ -40,6 +58,18 @@ class StorageBackend(ABC):
         """Store a file and return the storage path or identifier."""
         pass
 
+    @abstractmethod
+    def store_bytes(
+        self,
+        user: User,
+        data: bytes,
+        book_dir: str,
+        filename: str,
+        filetype: StorageFileType,
+    ) -> Path:
+        """Store in-memory content as a file and return the storage path or identifier."""
+        pass
+
     @abstractmethod
     def delete_file(
         self,
@@ -51,6 +81,15 @@ class StorageBackend(ABC):
         """Delete a file by its storage identifier and type."""
         pass
 
+    def delete_files(
+        self,
+        user: User,
+        book_dir: str,
+        files: list[tuple[str, StorageFileType]],
+    ) -> int:
+        """Delete several `(filename, filetype)` files of one book directory and return how many were deleted."""
+        return sum(self.delete_file(user, book_dir, filename, filetype) for filename, filetype in files)
+
     @abstractmethod
     def get_prepared_book_dir(self, user: User, book_dir: str) -> Path:
         """
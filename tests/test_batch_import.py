@@ -0,0 +1,91 @@
+import asyncio
+from pathlib import Path
+import shutil
+
+import fitz
+import pytest
+
+from core.config import settings
+from database import book_crud
+from models.user import User
+from parsers.batch import parse_batch
+from parsers.columnar import STORED_BOOK_COLUMNS
+from services.book_service import BookService
+from services.storage.filesystem_storage import FileSystemStorage
+
+
+def write_pdf(path: Path, title: str, author: str) -> Path:
+    document = fitz.open()
+    page = document.new_page()
+    page.insert_text((72, 72), title)
+    document.set_metadata({"title": title, "author": author})
+    document.save(path)
+    document.close()
+    return path
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> list[Path]:
+    source = tmp_path / "library"
+    source.mkdir()
+
+    first = write_pdf(source / "earthsea.pdf", "A Wizard of Earthsea", "Le Guin, Ursula K.")
+    second = write_pdf(source / "tombs.pdf", "The Tombs of Atuan", "Ursula K. Le Guin")
+    duplicate = shutil.copy(first, source / "earthsea-copy.pdf")
+    unsupported = source / "notes.txt"
+    unsupported.write_text("not a book")
+
+    return [first, second, Path(duplicate), unsupported]
+
+
+def test_parse_batch_skips_unsupported_formats(library: list[Path]):
+    batch = parse_batch(library, max_workers=2)
+
+    assert batch.file_paths == library[:3]
+    assert batch.titles == ["A Wizard of Earthsea", "The Tombs of Atuan", "A Wizard of Earthsea"]
+    assert batch.authors[0] == [{"name": "Le Guin, Ursula K."}]
+    assert batch.formats == ["PDF", "PDF", "PDF"]
+    assert all(cover is not None for cover in batch.covers)
+
+
+def test_to_rows_requires_stored_book_columns(library: list[Path]):
+    batch = parse_batch(library[:1], max_workers=1)
+
+    with pytest.raises(ValueError, match="file_hash"):
+        batch.to_rows([0], {}, user_id="U1", status="completed")
+
+
+def test_import_books_stores_files_and_inserts_completed_rows(library, tmp_path, monkeypatch):
+    inserted: list[dict] = []
+
+    async def get_existing_file_hashes(db, file_hashes):
+        return set()
+
+    async def create_books_bulk(db, books_data):
+        inserted.extend(books_data)
+        return [f"B{i}" for i in range(len(books_data))]
+
+    async def get_storage_backend(self, user):
+        return FileSystemStorage()
+
+    monkeypatch.setattr(settings, "BOOK_FILES_DIR", tmp_path / "books")
+    monkeypatch.setattr(book_crud, "get_existing_file_hashes", get_existing_file_hashes)
+    monkeypatch.setattr(book_crud, "create_books_bulk", create_books_bulk)
+    monkeypatch.setattr(BookService, "get_storage_backend", get_storage_backend)
+
+    user = User(id="U1")
+    book_ids = asyncio.run(BookService(None).import_books(library, user))
+
+    # The copy shares its hash with the first book and the text file has no parser.
+    assert book_ids == ["B0", "B1"]
+    assert [row["title"] for row in inserted] == ["A Wizard of Earthsea", "The Tombs of Atuan"]
+
+    for row, source in zip(inserted, library[:2], strict=True):
+        assert row.keys() >= STORED_BOOK_COLUMNS
+        assert row["status"] == "completed"
+        assert row["user_id"] == "U1"
+        assert row["file_size_bytes"] == source.stat().st_size
+        assert Path(row["file_path"]).read_bytes() == source.read_bytes()
+        assert {cover["variant"] for cover in row["covers"]} == {"original", "thumbnail"}
+
+    assert all(source.exists() for source in library)
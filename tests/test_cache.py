@@ -0,0 +1,19 @@
+from core.cache import MISSING, TTLCache
+
+
+def test_set_drops_values_read_before_an_invalidation():
+    cache = TTLCache(ttl=60)
+    generation = cache.generation
+
+    # A concurrent write invalidates the key while the stale value is being loaded.
+    cache.invalidate("user")
+    cache.set("user", "previous default", generation)
+
+    assert cache.get("user") is MISSING
+
+
+def test_set_keeps_values_read_without_an_invalidation():
+    cache = TTLCache(ttl=60)
+    cache.set("user", "default", cache.generation)
+
+    assert cache.get("user") == "default"
@@ -0,0 +1,181 @@
+from pathlib import Path
+import zipfile
+
+from lxml import etree
+import pytest
+
+from parsers.base_parser import Author, Identifier
+from parsers.epub_parser import (
+    EpubParser,
+    find_cover_item,
+    find_opf_path,
+    html_to_text,
+    read_dc_metadata,
+    XML_PARSER,
+)
+
+CONTAINER_XML = """<?xml version="1.0"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>
+"""
+
+PACKAGE_OPF = """<?xml version="1.0" encoding="utf-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="uid">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">
+    <dc:title>A Wizard of Earthsea</dc:title>
+    <dc:creator>Ursula K. Le Guin</dc:creator>
+    <dc:creator>Ruth Robbins</dc:creator>
+    <dc:language>en</dc:language>
+    <dc:identifier id="uid">urn:uuid:1234</dc:identifier>
+    <dc:identifier opf:scheme="ISBN">978-0-553-26250-4</dc:identifier>
+    <dc:publisher>Parnassus Press</dc:publisher>
+    <dc:date>1968</dc:date>
+    <dc:description>&lt;p&gt;A &lt;b&gt;wizard&lt;/b&gt; comes of age.&lt;/p&gt;</dc:description>
+    <dc:subject>Fantasy</dc:subject>
+    <dc:subject>Magic</dc:subject>
+    <meta name="cover" content="cover-img"/>
+  </metadata>
+  <manifest>
+    <item id="chapter" href="text/chapter.xhtml" media-type="application/xhtml+xml"/>
+    <item id="cover-img" href="images/front%20cover.png" media-type="image/png"/>
+  </manifest>
+  <spine>
+    <itemref idref="chapter"/>
+  </spine>
+</package>
+"""
+
+COVER_BYTES = b"\x89PNG\r\n\x1a\nnot really a png"
+
+
+def write_epub(path: Path, members: dict[str, str | bytes]) -> Path:
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+
+        for name, data in members.items():
+            archive.writestr(name, data, compress_type=zipfile.ZIP_DEFLATED)
+
+    return path
+
+
+@pytest.fixture
+def epub_path(tmp_path: Path) -> Path:
+    return write_epub(
+        tmp_path / "earthsea.epub",
+        {
+            "META-INF/container.xml": CONTAINER_XML,
+            "OEBPS/content.opf": PACKAGE_OPF,
+            "OEBPS/text/chapter.xhtml": "<html><body><p>Chapter</p></body></html>",
+            "OEBPS/images/front cover.png": COVER_BYTES,
+        },
+    )
+
+
+def manifest(items: str, metadata: str = "") -> etree._Element:
+    return etree.fromstring(
+        f"""<package xmlns="http://www.idpf.org/2007/opf">
+          <metadata>{metadata}</metadata>
+          <manifest>{items}</manifest>
+        </package>""",
+        XML_PARSER,
+    )
+
+
+def test_parse_reads_metadata_and_cover(epub_path: Path):
+    metadata, cover = EpubParser().parse(epub_path)
+
+    assert metadata == {
+        "title": "A Wizard of Earthsea",
+        "authors": [Author("Ursula K. Le Guin"), Author("Ruth Robbins")],
+        "language": "en",
+        "identifiers": [Identifier("UNKNOWN", "urn:uuid:1234"), Identifier("ISBN_13", "9780553262504")],
+        "publisher": "Parnassus Press",
+        "publication_date": "1968",
+        "description": "A wizard comes of age.",
+        "tags": ["Fantasy", "Magic"],
+        "format": "EPUB",
+    }
+    assert cover == (COVER_BYTES, "image/png")
+
+
+def test_parse_matches_separate_extractors(epub_path: Path):
+    parser = EpubParser()
+
+    assert parser.parse(epub_path) == (parser.parse_metadata(epub_path), parser.extract_cover_image_data(epub_path))
+
+
+def test_parse_reports_unreadable_archive(tmp_path: Path):
+    path = tmp_path / "broken.epub"
+    path.write_bytes(b"not a zip file")
+
+    metadata, cover = EpubParser().parse(path)
+
+    assert "parsing_error" in metadata
+    assert cover is None
+
+
+def test_find_opf_path_falls_back_without_container(tmp_path: Path):
+    path = write_epub(tmp_path / "no-container.epub", {"book/package.opf": PACKAGE_OPF})
+
+    with zipfile.ZipFile(path) as archive:
+        assert find_opf_path(archive) == "book/package.opf"
+
+
+def test_read_dc_metadata_groups_elements_by_name(epub_path: Path):
+    with zipfile.ZipFile(epub_path) as archive:
+        dc = read_dc_metadata(archive, find_opf_path(archive))
+
+    assert [element.text for element in dc["creator"]] == ["Ursula K. Le Guin", "Ruth Robbins"]
+    assert [element.text for element in dc["subject"]] == ["Fantasy", "Magic"]
+    assert "meta" not in dc
+
+
+def test_find_cover_item_prefers_cover_image_property():
+    opf = manifest(
+        '<item id="a" href="cover.jpg" media-type="image/jpeg"/>'
+        '<item id="b" href="art.png" media-type="image/png" properties="cover-image"/>',
+    )
+
+    assert find_cover_item(opf).get("id") == "b"
+
+
+def test_find_cover_item_follows_meta_pointer():
+    opf = manifest(
+        '<item id="page" href="cover.xhtml" media-type="application/xhtml+xml"/>'
+        '<item id="img" href="front.jpg" media-type="image/jpeg"/>',
+        metadata='<meta name="cover" content="img"/>',
+    )
+
+    assert find_cover_item(opf).get("id") == "img"
+
+
+def test_find_cover_item_ignores_non_image_declarations():
+    opf = manifest(
+        '<item id="page" href="cover.xhtml" media-type="application/xhtml+xml" properties="cover-image"/>'
+        '<item id="img" href="images/Cover.JPG" media-type="image/jpeg"/>',
+    )
+
+    assert find_cover_item(opf).get("id") == "img"
+
+
+def test_find_cover_item_returns_none_without_cover():
+    opf = manifest('<item id="img" href="figure.png" media-type="image/png"/>')
+
+    assert find_cover_item(opf) is None
+
+
+@pytest.mark.parametrize(
+    ("markup", "expected"),
+    [
+        ("A plain description.", "A plain description."),
+        ("Tom &amp; Jerry", "Tom & Jerry"),
+        ("&#233;t&eacute;", "été"),
+        ("<p>A <b>bold</b> &lt;claim&gt;</p>", "A bold <claim>"),
+        ("<!-- nothing -->", ""),
+    ],
+)
+def test_html_to_text_decodes_tags_and_entities(markup: str, expected: str):
+    assert html_to_text(markup) == expected
@@ -0,0 +1,21 @@
+import pytest
+
+from parsers.pdf_parser import split_authors
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("Le Guin, Ursula K.", ["Le Guin, Ursula K."]),
+        ("Tolkien, J. R. R.", ["Tolkien, J. R. R."]),
+        ("van Gogh, Vincent Willem", ["van Gogh, Vincent Willem"]),
+        ("Barnes and Noble", ["Barnes and Noble"]),
+        ("Simon & Schuster", ["Simon & Schuster"]),
+        ("Jane Doe; John Roe", ["Jane Doe", "John Roe"]),
+        (" Jane Doe ;John Roe; ", ["Jane Doe", "John Roe"]),
+        ("", []),
+        (" ; ", []),
+    ],
+)
+def test_split_authors_only_splits_on_semicolons(value, expected):
+    assert split_authors(value) == expected